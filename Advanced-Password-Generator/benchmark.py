@@ -0,0 +1,304 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import secrets
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from password_core import (
+    MAX_LENGTH,
+    MIN_LENGTH,
+    build_alphabet,
+    calculate_entropy,
+    generate_passwords,
+    score_passwords,
+    strength_from_entropy,
+)
+from password_parallel import generate_parallel
+from password_policy import generate_policy_passwords
+
+COUNT = 200_000
+LENGTH = 16
+LENGTHS = (8, 12, 16, 24, 32)
+
+# A throughput drop larger than this fraction counts as a regression
+REGRESSION_TOLERANCE = 0.15
+
+# Short-lived provisioning jobs expect the core to import in a few ms
+IMPORT_BUDGET_MS = 5.0
+
+# Every non-empty combination of (letters, digits, symbols)
+CHARACTER_SETS = [
+    combo for combo in itertools.product((True, False), repeat=3) if any(combo)
+]
+
+POLICIES = (
+    ("no minimums", {}),
+    ("1 of each", {"letters": 1, "digits": 1, "symbols": 1}),
+    ("2 of each", {"letters": 2, "digits": 2, "symbols": 2}),
+    ("2/3/3", {"letters": 2, "digits": 3, "symbols": 3}),
+)
+
+
+def per_character_loop(count, length):
+    # The original GUI approach: one secrets.choice call per character
+    all_characters = build_alphabet()
+    return [
+        "".join(secrets.choice(all_characters) for _ in range(length))
+        for _ in range(count)
+    ]
+
+
+def measure(func, *args, repeat=3):
+    # Best of `repeat` runs, to reduce noise from the rest of the system
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def charset_name(letters, digits, symbols):
+    enabled = zip(("letters", "digits", "symbols"), (letters, digits, symbols))
+    return "+".join(name for name, on in enabled if on)
+
+
+def import_time_ms(module):
+    # Run in a fresh interpreter with bytecode caching enabled; the first run
+    # warms the cache so the second measures a normal start-up.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    for _ in range(2):
+        result = subprocess.run(command, cwd=here, env=env, capture_output=True, text=True)
+
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"Could not measure import time of {module}")
+
+
+def bench_import():
+    elapsed = import_time_ms("password_core")
+    return [{
+        "name": "import",
+        "module": "password_core",
+        "ms": round(elapsed, 3),
+        "budget_ms": IMPORT_BUDGET_MS,
+        "within_budget": elapsed <= IMPORT_BUDGET_MS,
+    }]
+
+
+def bench_baseline(count):
+    baseline = measure(per_character_loop, count, LENGTH, repeat=1)
+    bulk = measure(generate_passwords, count, LENGTH)
+    return [
+        {"name": "per_character_loop", "length": LENGTH, "count": count,
+         "per_sec": round(count / baseline)},
+        {"name": "bulk_token_bytes", "length": LENGTH, "count": count,
+         "per_sec": round(count / bulk), "speedup": round(baseline / bulk, 1)},
+    ]
+
+
+def bench_generation(count):
+    results = []
+    for length in LENGTHS:
+        for classes in CHARACTER_SETS:
+            elapsed = measure(generate_passwords, count, length, *classes)
+            results.append({
+                "name": "generate",
+                "length": length,
+                "charset": charset_name(*classes),
+                "count": count,
+                "per_sec": round(count / elapsed),
+            })
+    return results
+
+
+def bench_policy(count):
+    results = []
+    for length in (MIN_LENGTH, LENGTH, MAX_LENGTH):
+        for name, minimums in POLICIES:
+            elapsed = measure(
+                generate_policy_passwords, count, length, True, True, True, minimums
+            )
+            results.append({
+                "name": "generate_policy",
+                "length": length,
+                "policy": name,
+                "count": count,
+                "per_sec": round(count / elapsed),
+            })
+    return results
+
+
+def _score_one_by_one(passwords):
+    for password in passwords:
+        strength_from_entropy(calculate_entropy(password))
+
+
+def bench_scoring(count):
+    results = []
+    for length in (MIN_LENGTH, LENGTH, MAX_LENGTH):
+        passwords = generate_passwords(count, length)
+        single = measure(_score_one_by_one, passwords)
+        batch = measure(score_passwords, passwords)
+        results.append({"name": "score_single", "length": length, "count": count,
+                        "per_sec": round(count / single)})
+        results.append({"name": "score_batch", "length": length, "count": count,
+                        "per_sec": round(count / batch)})
+    return results
+
+
+def bench_memory(count):
+    results = []
+    for label, func in (("generate", generate_passwords),
+                        ("generate_policy", generate_policy_passwords)):
+        tracemalloc.start()
+        passwords = func(count, LENGTH)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del passwords
+        results.append({
+            "name": "peak_memory",
+            "function": label,
+            "length": LENGTH,
+            "count": count,
+            "peak_bytes": peak,
+            "bytes_per_password": round(peak / count, 1),
+        })
+    return results
+
+
+def bench_parallel(count):
+    results = []
+    single = None
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        elapsed = measure(generate_parallel, count, LENGTH, True, True, True, workers, repeat=1)
+        single = single or elapsed
+        results.append({
+            "name": "generate_parallel",
+            "workers": workers,
+            "length": LENGTH,
+            "count": count,
+            "per_sec": round(count / elapsed),
+            "scaling": round(single / elapsed, 2),
+        })
+        workers *= 2
+    return results
+
+
+def format_result(result):
+    details = ", ".join(
+        f"{key}={value}" for key, value in result.items()
+        if key not in ("name", "per_sec", "count")
+    )
+    rate = f"{result['per_sec']:>12,}/sec" if "per_sec" in result else " " * 16
+    return f"  {result['name']:<20}{rate}  {details}"
+
+
+def _result_key(result):
+    # count stays in the key: throughput depends on batch size, so a --quick
+    # run is only compared with other runs at the same count
+    measured = ("per_sec", "speedup", "scaling", "ms", "within_budget",
+                "peak_bytes", "bytes_per_password")
+    return tuple(sorted((key, value) for key, value in result.items() if key not in measured))
+
+
+def find_regressions(baseline, results, tolerance=REGRESSION_TOLERANCE):
+    # Returns (regressions, number of results that had a baseline to compare with)
+    previous = {_result_key(result): result for result in baseline["results"]}
+    regressions = []
+    compared = 0
+    for result in results:
+        before = previous.get(_result_key(result))
+        if not before or "per_sec" not in result:
+            continue
+        compared += 1
+        if result["per_sec"] < before["per_sec"] * (1 - tolerance):
+            regressions.append((result, before["per_sec"]))
+    return regressions, compared
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Password generation and scoring benchmarks.")
+    parser.add_argument("--count", type=int, default=COUNT, help="passwords per measurement")
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON ('-' for stdout)")
+    parser.add_argument(
+        "--compare", metavar="PATH",
+        help="earlier JSON report; exit with status 1 if throughput regressed"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=REGRESSION_TOLERANCE,
+        help="allowed fractional throughput drop when comparing"
+    )
+    parser.add_argument("--quick", action="store_true", help="smaller batches for a fast smoke run")
+    parser.add_argument("--skip-parallel", action="store_true", help="skip the process-pool benchmark")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    count = args.count // 20 if args.quick else args.count
+    # Keep stdout clean for the JSON report when it goes there
+    log = sys.stderr if args.json == "-" else sys.stdout
+
+    suites = [
+        ("Import time", bench_import, None),
+        ("Per-character loop vs bulk generation", bench_baseline, count),
+        ("Generation by length and character set", bench_generation, count),
+        ("Policy-guaranteed generation", bench_policy, count // 4),
+        ("Scoring: one call per password vs batch", bench_scoring, count),
+        ("Peak memory", bench_memory, count * 5),
+    ]
+    if not args.skip_parallel:
+        suites.append(("Process-pool scaling", bench_parallel, count * 10))
+
+    results = []
+    for title, suite, size in suites:
+        print(title, file=log)
+        batch = suite() if size is None else suite(size)
+        for result in batch:
+            print(format_result(result), file=log)
+        results.extend(batch)
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w", encoding="utf-8") as out:
+                json.dump(report, out, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            regressions, compared = find_regressions(json.load(previous), results, args.tolerance)
+        if not compared:
+            sys.exit(
+                f"error: nothing in {args.compare} was measured with the same settings "
+                "(compare --quick runs only with --quick runs, at the same --count)"
+            )
+        for result, before in regressions:
+            print(f"REGRESSION (was {before:,}/sec):{format_result(result)}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import hashlib
+import math
+import mmap
+import struct
+import sys
+
+# File layout: fixed header, padded to one block, followed by the blocks
+#   magic (8 bytes) | block count (Q) | hash count (I) | entry count (Q)
+MAGIC = b"PWBLOOM1"
+HEADER = struct.Struct("<8sQIQ")
+
+# Blocked Bloom filter: all bits for one password live in the same 64-byte
+# block, so a lookup touches a single cache line and a single page.
+BLOCK_BYTES = 64
+BLOCK_BITS = BLOCK_BYTES * 8
+MAX_HASHES = 14
+
+# Blocking raises the false-positive rate slightly, so allocate extra bits
+BLOCKING_OVERHEAD = 1.2
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+
+def filter_size(entries, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+    entries = max(entries, 1)
+    bits = -entries * math.log(false_positive_rate) / math.log(2) ** 2
+    blocks = math.ceil(bits * BLOCKING_OVERHEAD / BLOCK_BITS)
+    hashes = min(MAX_HASHES, max(1, round(bits / entries * math.log(2))))
+    return blocks, hashes
+
+
+def _locate(password, blocks, hashes):
+    # One 192-bit BLAKE2b digest: the low 64 bits pick the block and each
+    # following 9-bit slice picks one bit inside it.
+    digest = int.from_bytes(
+        hashlib.blake2b(password.encode("utf-8", "surrogateescape"), digest_size=24).digest(),
+        "little",
+    )
+    block = (digest & 0xFFFFFFFFFFFFFFFF) % blocks
+    digest >>= 64
+    mask = 0
+    for _ in range(hashes):
+        mask |= 1 << (digest & (BLOCK_BITS - 1))
+        digest >>= 9
+    return BLOCK_BYTES * (block + 1), mask
+
+
+def _iter_corpus(path):
+    with open(path, "r", encoding="utf-8", errors="surrogateescape") as corpus:
+        for line in corpus:
+            password = line.rstrip("\r\n")
+            if password:
+                yield password
+
+
+def _count_lines(path):
+    count = 0
+    with open(path, "rb") as corpus:
+        for block in iter(lambda: corpus.read(1024 * 1024), b""):
+            count += block.count(b"\n")
+    return count
+
+
+def build_filter(corpus_path, filter_path, expected_entries=None,
+                 false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+    if expected_entries is None:
+        expected_entries = _count_lines(corpus_path)
+
+    blocks, hashes = filter_size(expected_entries, false_positive_rate)
+    entries = 0
+
+    # The filter is built inside the output file through mmap, so the corpus
+    # is streamed and only the pages being updated need to be resident.
+    with open(filter_path, "w+b") as out:
+        out.truncate(BLOCK_BYTES * (blocks + 1))
+        with mmap.mmap(out.fileno(), 0) as view:
+            for password in _iter_corpus(corpus_path):
+                start, mask = _locate(password, blocks, hashes)
+                end = start + BLOCK_BYTES
+                block = int.from_bytes(view[start:end], "little")
+                view[start:end] = (block | mask).to_bytes(BLOCK_BYTES, "little")
+                entries += 1
+            view[:HEADER.size] = HEADER.pack(MAGIC, blocks, hashes, entries)
+            view.flush()
+
+    return entries
+
+
+class BreachFilter:
+    def __init__(self, filter_path):
+        self._file = open(filter_path, "rb")
+        self._view = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.blocks, self.hashes, self.entries = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{filter_path} is not a breach filter file.")
+
+    def __contains__(self, password):
+        start, mask = _locate(password, self.blocks, self.hashes)
+        block = int.from_bytes(self._view[start:start + BLOCK_BYTES], "little")
+        return block & mask == mask
+
+    def is_breached(self, password):
+        return password in self
+
+    def filter_passwords(self, passwords):
+        return [password for password in passwords if password not in self]
+
+    def close(self):
+        self._view.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build or query an on-disk Bloom filter of breached passwords."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="build a filter from a corpus (one password per line)")
+    build.add_argument("corpus")
+    build.add_argument("filter")
+    build.add_argument("--entries", type=int, help="expected entries (default: count lines)")
+    build.add_argument(
+        "--fp-rate", type=float, default=DEFAULT_FALSE_POSITIVE_RATE,
+        help="target false-positive rate"
+    )
+
+    check = commands.add_parser("check", help="check passwords read from stdin")
+    check.add_argument("filter")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        entries = build_filter(args.corpus, args.filter, args.entries, args.fp_rate)
+        print(f"Indexed {entries} passwords into {args.filter}")
+    else:
+        with BreachFilter(args.filter) as breached:
+            for line in sys.stdin:
+                password = line.rstrip("\r\n")
+                print(f"{'BREACHED' if password in breached else 'ok'}\t{password}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import os
+import pprint
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Unshifted QWERTY rows, padded so that the key at (row, col) touches
+# (row - 1, col), (row - 1, col + 1), (row + 1, col - 1) and (row + 1, col).
+QWERTY_ROWS = (
+    "`1234567890-=",
+    " qwertyuiop[]\\",
+    " asdfghjkl;'",
+    " zxcvbnm,./",
+)
+
+SHIFTED = {
+    "~": "`", "!": "1", "@": "2", "#": "3", "$": "4", "%": "5", "^": "6",
+    "&": "7", "*": "8", "(": "9", ")": "0", "_": "-", "+": "=", "{": "[",
+    "}": "]", "|": "\\", ":": ";", '"': "'", "<": ",", ">": ".", "?": "/",
+}
+
+# Common character substitutions undone before dictionary lookups
+LEET = {"4": "a", "@": "a", "3": "e", "1": "i", "!": "i", "0": "o", "$": "s", "5": "s", "7": "t"}
+
+
+def read_words(path):
+    ranks = {}
+    with open(path, encoding="utf-8") as wordlist:
+        for line in wordlist:
+            word = line.strip().lower()
+            if word and not word.startswith("#") and word not in ranks:
+                ranks[word] = len(ranks) + 1
+    return ranks
+
+
+def keyboard_positions(rows):
+    return {
+        key: (row, col)
+        for row, keys in enumerate(rows)
+        for col, key in enumerate(keys)
+        if key != " "
+    }
+
+
+def keyboard_adjacency(rows):
+    def key_at(row, col):
+        if 0 <= row < len(rows) and 0 <= col < len(rows[row]) and rows[row][col] != " ":
+            return rows[row][col]
+        return None
+
+    adjacency = {}
+    for row, keys in enumerate(rows):
+        for col, key in enumerate(keys):
+            if key == " ":
+                continue
+            around = (
+                (row, col - 1), (row, col + 1),
+                (row - 1, col), (row - 1, col + 1),
+                (row + 1, col - 1), (row + 1, col),
+            )
+            adjacency[key] = "".join(
+                neighbour for neighbour in (key_at(r, c) for r, c in around) if neighbour
+            )
+    return adjacency
+
+
+def render(ranks, adjacency, positions):
+    average_degree = sum(map(len, adjacency.values())) / len(adjacency)
+    unshift = {ord(shifted): ord(base) for shifted, base in SHIFTED.items()}
+    unshift.update({ord(upper): ord(upper.lower()) for upper in map(chr, range(65, 91))})
+    leet = {ord(char): ord(plain) for char, plain in LEET.items()}
+    prefixes = sorted({word[:end] for word in ranks for end in range(1, len(word) + 1)})
+
+    return "\n".join([
+        "# Generated by build_pattern_data.py -- do not edit by hand.",
+        "",
+        f"WORD_RANKS = {pprint.pformat(ranks, width=100, sort_dicts=False)}",
+        "",
+        "# Every prefix of a dictionary word, so scans can stop early",
+        f"WORD_PREFIXES = frozenset({pprint.pformat(prefixes, width=100, compact=True)})",
+        "",
+        f"KEYBOARD_ADJACENCY = {pprint.pformat(adjacency, width=100)}",
+        "",
+        f"KEYBOARD_POSITIONS = {pprint.pformat(positions, width=100)}",
+        "",
+        f"KEYBOARD_AVERAGE_DEGREE = {average_degree!r}",
+        "",
+        "# str.translate tables",
+        f"UNSHIFT = {pprint.pformat(unshift, width=100)}",
+        "",
+        f"LEET = {pprint.pformat(leet, width=100)}",
+        "",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Precompile dictionaries and keyboard graphs for pattern_strength.py."
+    )
+    parser.add_argument("--words", default=os.path.join(HERE, "pattern_words.txt"))
+    parser.add_argument("--output", default=os.path.join(HERE, "pattern_data.py"))
+    args = parser.parse_args(argv)
+
+    ranks = read_words(args.words)
+    with open(args.output, "w", encoding="utf-8") as out:
+        out.write(render(
+            ranks, keyboard_adjacency(QWERTY_ROWS), keyboard_positions(QWERTY_ROWS)
+        ))
+    print(f"Wrote {len(ranks)} words to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
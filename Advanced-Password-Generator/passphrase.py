@@ -0,0 +1,143 @@
+import argparse
+import math
+import mmap
+import secrets
+import struct
+import sys
+
+from password_core import strength_from_entropy
+
+# Index layout: header followed by fixed-width, NUL-padded word records, so
+# word `i` is found at HEADER.size + i * width without any parsing.
+#   magic (8 bytes) | word count (Q) | record width (I)
+MAGIC = b"PWWORDS1"
+HEADER = struct.Struct("<8sQI")
+
+DEFAULT_WORDS = 6
+DEFAULT_SEPARATOR = "-"
+
+
+def _read_words(wordlist_path):
+    seen = set()
+    words = []
+    with open(wordlist_path, "r", encoding="utf-8") as wordlist:
+        for line in wordlist:
+            word = line.strip()
+            if not word:
+                continue
+            # Accept both plain lists and Diceware "11111<TAB>word" lists;
+            # only the dice number is split off, so words may hold spaces
+            fields = word.split(None, 1)
+            if len(fields) == 2 and fields[0].isdigit():
+                word = fields[1]
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+    return words
+
+
+def build_index(wordlist_path, index_path):
+    words = _read_words(wordlist_path)
+    if len(words) < 2:
+        raise ValueError("A wordlist needs at least two distinct words.")
+
+    encoded = [word.encode("utf-8") for word in words]
+    width = max(map(len, encoded))
+
+    with open(index_path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(encoded), width))
+        out.write(b"".join(word.ljust(width, b"\0") for word in encoded))
+
+    return len(encoded)
+
+
+class WordList:
+    def __init__(self, index_path):
+        self._file = open(index_path, "rb")
+        self._view = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, self.width = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{index_path} is not a wordlist index file.")
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError("word index out of range")
+        start = HEADER.size + index * self.width
+        return self._view[start:start + self.width].rstrip(b"\0").decode("utf-8")
+
+    def bits_per_word(self):
+        return math.log2(self.size)
+
+    def close(self):
+        self._view.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def passphrase_entropy(words, wordlist_size):
+    return round(words * math.log2(wordlist_size), 1)
+
+
+def random_indices(size, count):
+    # Same idea as secrets.randbelow, but for a whole batch: 32-bit values
+    # from one token_bytes call, dropping those above the largest multiple
+    # of `size` so every index stays equally likely.
+    limit = (1 << 32) - (1 << 32) % size
+    indices = []
+    while len(indices) < count:
+        needed = count - len(indices)
+        values = memoryview(secrets.token_bytes(4 * (needed + needed // 8 + 8))).cast("I")
+        indices.extend([value % size for value in values if value < limit])
+    del indices[count:]
+    return indices
+
+
+def generate_passphrases(wordlist, count, words=DEFAULT_WORDS, separator=DEFAULT_SEPARATOR):
+    if words < 1:
+        raise ValueError("A passphrase needs at least one word.")
+
+    picked = list(map(wordlist.__getitem__, random_indices(len(wordlist), count * words)))
+    return [
+        separator.join(picked[start:start + words])
+        for start in range(0, count * words, words)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diceware-style passphrase generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="index a wordlist (one word per line)")
+    build.add_argument("wordlist")
+    build.add_argument("index")
+
+    generate = commands.add_parser("generate", help="generate passphrases from an index")
+    generate.add_argument("index")
+    generate.add_argument("-n", "--count", type=int, default=1, help="number of passphrases")
+    generate.add_argument("-w", "--words", type=int, default=DEFAULT_WORDS, help="words per passphrase")
+    generate.add_argument("-s", "--separator", default=DEFAULT_SEPARATOR)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        print(f"Indexed {build_index(args.wordlist, args.index)} words into {args.index}")
+    else:
+        with WordList(args.index) as wordlist:
+            entropy = passphrase_entropy(args.words, len(wordlist))
+            label, _ = strength_from_entropy(entropy)
+            for phrase in generate_passphrases(wordlist, args.count, args.words, args.separator):
+                print(phrase)
+            print(f"Strength: {label} ({entropy} bits)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import argparse
+import sys
+
+from password_core import (
+    MAX_LENGTH,
+    MIN_LENGTH,
+    STREAM_CHUNK_SIZE,
+    iter_password_chunks,
+    write_chunks,
+)
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream secure passwords to a file or stdout."
+    )
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of passwords")
+    parser.add_argument(
+        "-l", "--length", type=int, default=16,
+        help=f"password length ({MIN_LENGTH}-{MAX_LENGTH})"
+    )
+    parser.add_argument("--no-letters", action="store_true", help="exclude letters")
+    parser.add_argument("--no-digits", action="store_true", help="exclude digits")
+    parser.add_argument("--no-symbols", action="store_true", help="exclude symbols")
+    parser.add_argument(
+        "--entropy", action="store_true",
+        help="append entropy bits and strength label to each line"
+    )
+    parser.add_argument(
+        "--chunk-size", type=positive_int, default=STREAM_CHUNK_SIZE,
+        help="passwords generated and written per batch"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="worker processes (0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--unordered", action="store_true",
+        help="with several workers, write chunks as soon as they are ready"
+    )
+    parser.add_argument(
+        "--unique", action="store_true",
+        help="guarantee no duplicates in the output (single process; not with --workers or --unordered)"
+    )
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    args = parser.parse_args(argv)
+    # The dedup table lives in this process, so unique output is generated here
+    if args.unique and (args.workers != 1 or args.unordered):
+        parser.error("--unique cannot be combined with --workers or --unordered")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    classes = (not args.no_letters, not args.no_digits, not args.no_symbols)
+
+    try:
+        if args.unique:
+            from password_unique import DigestSet, check_unique_request, iter_unique_chunks
+
+            check_unique_request(args.count, args.length, *classes, chunk_size=args.chunk_size)
+            seen = DigestSet(args.count)
+            chunks = iter_unique_chunks(
+                args.count, args.length, *classes, chunk_size=args.chunk_size, seen=seen
+            )
+        elif args.workers == 1:
+            chunks = iter_password_chunks(
+                args.count, args.length, *classes, chunk_size=args.chunk_size
+            )
+        else:
+            # Imported here so single-process runs skip the multiprocessing
+            # start-up cost
+            from password_parallel import iter_parallel_chunks
+
+            chunks = iter_parallel_chunks(
+                args.count, args.length, *classes,
+                workers=args.workers or None,
+                ordered=not args.unordered,
+                chunk_size=args.chunk_size,
+            )
+
+        if args.output == "-":
+            write_chunks(sys.stdout, chunks, args.entropy)
+        else:
+            with open(args.output, "w", encoding="ascii", buffering=1024 * 1024) as out:
+                write_chunks(out, chunks, args.entropy)
+
+        if args.unique:
+            print(
+                "Duplicates rejected: {duplicates_rejected}, "
+                "dedup table: {table_bytes} bytes".format(**seen.stats()),
+                file=sys.stderr
+            )
+    except ValueError as err:
+        sys.exit(f"error: {err}")
+    except BrokenPipeError:
+        # The reading end of a pipe was closed (e.g. `| head`)
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
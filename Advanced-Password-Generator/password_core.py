@@ -0,0 +1,235 @@
+import math
+import os
+from bisect import bisect_right
+
+# Same values as string.ascii_letters / string.digits, spelled out because
+# importing `string` pulls in `re` and triples the import time of this module
+ASCII_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS = "0123456789"
+SYMBOLS = "!@#$%^&*()-_=+[]{};:,.<>?/"
+
+MIN_LENGTH = 8
+MAX_LENGTH = 32
+
+# Upper bound on a single read from the OS random source
+TOKEN_BLOCK_SIZE = 1024 * 1024
+
+LOWER = 1
+UPPER = 2
+DIGIT = 4
+SYMBOL = 8
+
+# Pool size contributed by each character class
+CLASS_POOL = {LOWER: 26, UPPER: 26, DIGIT: 10, SYMBOL: len(SYMBOLS)}
+
+# Entropy thresholds and the label/colour for each strength bucket
+STRENGTH_THRESHOLDS = (40, 60, 80)
+STRENGTH_LEVELS = (
+    ("Weak", "#C62828"),
+    ("Moderate", "#EF6C00"),
+    ("Strong", "#2E7D32"),
+    ("Excellent", "#6B9080"),
+)
+
+
+def _class_of(char):
+    if char.islower():
+        return LOWER
+    if char.isupper():
+        return UPPER
+    if char.isdigit():
+        return DIGIT
+    if char in SYMBOLS:
+        return SYMBOL
+    return 0
+
+
+# Translating a password through this table replaces every ASCII character
+# by its class bitmask (as a control character) and drops classless ones,
+# so a single C-level pass plus set() yields the classes present.
+_CLASS_TABLE = {
+    code: chr(_class_of(chr(code))) if _class_of(chr(code)) else None
+    for code in range(128)
+}
+
+# log2 of the pool size for each of the 16 possible class combinations
+_POOL_BITS = tuple(
+    math.log2(sum(size for bit, size in CLASS_POOL.items() if mask & bit))
+    if mask else 0.0
+    for mask in range(16)
+)
+
+
+def build_alphabet(letters=True, digits=True, symbols=True):
+    character_sets = []
+
+    if letters:
+        character_sets.append(ASCII_LETTERS)
+    if digits:
+        character_sets.append(DIGITS)
+    if symbols:
+        character_sets.append(SYMBOLS)
+
+    if not character_sets:
+        raise ValueError("Please select at least one character type.")
+
+    return "".join(character_sets)
+
+
+def check_length(length):
+    if length < MIN_LENGTH or length > MAX_LENGTH:
+        raise ValueError(
+            f"Password length must be between {MIN_LENGTH} and {MAX_LENGTH}."
+        )
+
+
+def class_mask(password):
+    translated = password.translate(_CLASS_TABLE)
+    if password.isascii():
+        # Markers are distinct bits, so summing the unique ones ORs them
+        return sum(map(ord, set(translated)))
+
+    mask = 0
+    for marker in set(translated):
+        code = ord(marker)
+        # Non-ASCII characters are not in the table and pass through as-is
+        mask |= code if code < 16 else _class_of(marker)
+    return mask
+
+
+def _entropy(mask, length):
+    if not mask:
+        return 0
+    return round(length * _POOL_BITS[mask], 1)
+
+
+def calculate_entropy(password):
+    return _entropy(class_mask(password), len(password))
+
+
+def strength_from_entropy(entropy):
+    return STRENGTH_LEVELS[bisect_right(STRENGTH_THRESHOLDS, entropy)]
+
+
+# (entropy, label) depends only on the class mask and the length
+_SCORE_CACHE = {}
+
+
+def _score(mask, length):
+    entropy = _entropy(mask, length)
+    result = _SCORE_CACHE[mask, length] = (entropy, strength_from_entropy(entropy)[0])
+    return result
+
+
+def score_passwords(passwords):
+    cache = _SCORE_CACHE
+    table = _CLASS_TABLE
+    results = []
+    append = results.append
+
+    for password in passwords:
+        if password.isascii():
+            key = sum(map(ord, set(password.translate(table)))), len(password)
+        else:
+            key = class_mask(password), len(password)
+        append(cache.get(key) or _score(*key))
+
+    return results
+
+
+def _byte_tables(alphabet):
+    # Bytes at or above `limit` are discarded so that every remaining byte
+    # value maps onto the alphabet the same number of times (no modulo bias).
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    table = bytes(
+        ord(alphabet[value % size]) if value < limit else 0
+        for value in range(256)
+    )
+    rejected = bytes(range(limit, 256))
+    return table, rejected, limit
+
+
+def random_characters(alphabet, count):
+    table, rejected, limit = _byte_tables(alphabet)
+    chunks = []
+    remaining = count
+
+    while remaining > 0:
+        # Over-draw by the expected rejection rate plus a small margin so
+        # that one read is almost always enough.
+        request = min(TOKEN_BLOCK_SIZE, remaining * 256 // limit + 64)
+        chunk = os.urandom(request).translate(table, rejected)
+        chunks.append(chunk[:remaining])
+        remaining -= len(chunks[-1])
+
+    return b"".join(chunks).decode("ascii")
+
+
+def generate_passwords(count, length, letters=True, digits=True, symbols=True):
+    check_length(length)
+    alphabet = build_alphabet(letters, digits, symbols)
+
+    if count < 0:
+        raise ValueError("Password count cannot be negative.")
+
+    text = random_characters(alphabet, count * length)
+    return [text[start:start + length] for start in range(0, count * length, length)]
+
+
+# Passwords produced per batch when streaming
+STREAM_CHUNK_SIZE = 50_000
+
+
+def check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+
+def iter_password_chunks(count, length, letters=True, digits=True, symbols=True,
+                         chunk_size=STREAM_CHUNK_SIZE):
+    check_length(length)
+    check_chunk_size(chunk_size)
+    build_alphabet(letters, digits, symbols)
+
+    if count < 0:
+        raise ValueError("Password count cannot be negative.")
+
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield generate_passwords(size, length, letters, digits, symbols)
+        remaining -= size
+
+
+def iter_passwords(count, length, letters=True, digits=True, symbols=True,
+                   chunk_size=STREAM_CHUNK_SIZE):
+    for chunk in iter_password_chunks(count, length, letters, digits, symbols, chunk_size):
+        yield from chunk
+
+
+def write_chunks(stream, chunks, with_entropy=False):
+    written = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if with_entropy:
+            lines = [
+                f"{password}\t{entropy}\t{label}"
+                for password, (entropy, label) in zip(chunk, score_passwords(chunk))
+            ]
+        else:
+            lines = chunk
+        # One write per chunk keeps syscalls low and memory flat
+        stream.write("\n".join(lines) + "\n")
+        written += len(chunk)
+
+    stream.flush()
+    return written
+
+
+def write_passwords(stream, count, length, letters=True, digits=True, symbols=True,
+                    with_entropy=False, chunk_size=STREAM_CHUNK_SIZE):
+    chunks = iter_password_chunks(count, length, letters, digits, symbols, chunk_size)
+    return write_chunks(stream, chunks, with_entropy)
@@ -0,0 +1,74 @@
+import numpy as np
+
+from password_core import (
+    MAX_LENGTH,
+    STRENGTH_LEVELS,
+    STRENGTH_THRESHOLDS,
+    _POOL_BITS,
+    _class_of,
+)
+
+# Rows are processed in slices of this size to bound temporary memory
+CHUNK_ROWS = 1_000_000
+
+STRENGTH_LABELS = np.array([label for label, _ in STRENGTH_LEVELS])
+
+# Class bitmask for every byte value. Only ASCII is classified; the bytes of
+# multi-byte UTF-8 sequences count towards length but not towards the pool.
+_BYTE_CLASS = np.array(
+    [_class_of(chr(value)) if value < 128 else 0 for value in range(256)],
+    dtype=np.uint8,
+)
+_MASK_BITS = np.array(_POOL_BITS, dtype=np.float64)
+_THRESHOLDS = np.array(STRENGTH_THRESHOLDS, dtype=np.float64)
+
+
+def to_array(passwords, width=MAX_LENGTH):
+    # A fixed-width dtype would silently cut longer passwords, so the array
+    # is built at the longest one's width and checked first
+    try:
+        array = np.array(passwords, dtype="S")
+    except UnicodeEncodeError:
+        raise ValueError("Only ASCII passwords can be scored as an array.") from None
+    if array.dtype.itemsize > width:
+        raise ValueError(f"Passwords longer than {width} characters cannot be scored as an array.")
+    return array.astype(f"S{width}", copy=False)
+
+
+def _score_chunk(raw):
+    present = raw != 0
+    width = raw.shape[1]
+
+    # Fixed-width byte strings are NUL padded on the right, so the length is
+    # the index just past the last non-NUL byte.
+    last = width - np.argmax(present[:, ::-1], axis=1)
+    lengths = np.where(present.any(axis=1), last, 0)
+
+    masks = np.bitwise_or.reduce(_BYTE_CLASS[raw], axis=1)
+    entropy = np.round(lengths * _MASK_BITS[masks], 1)
+    buckets = np.searchsorted(_THRESHOLDS, entropy, side="right").astype(np.uint8)
+    return entropy, buckets
+
+
+def score_array(passwords):
+    passwords = np.asarray(passwords)
+    if passwords.dtype.kind != "S":
+        raise TypeError("Expected a fixed-width byte string array (e.g. dtype 'S32').")
+
+    count = passwords.shape[0]
+    width = passwords.dtype.itemsize
+    # view() needs contiguous rows; slices such as arr[::2] are copied first
+    raw = np.ascontiguousarray(passwords).view(np.uint8).reshape(count, width)
+
+    entropy = np.empty(count, dtype=np.float64)
+    buckets = np.empty(count, dtype=np.uint8)
+
+    for start in range(0, count, CHUNK_ROWS):
+        stop = start + CHUNK_ROWS
+        entropy[start:stop], buckets[start:stop] = _score_chunk(raw[start:stop])
+
+    return entropy, buckets
+
+
+def strength_labels(buckets):
+    return STRENGTH_LABELS[buckets]
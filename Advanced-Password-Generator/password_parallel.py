@@ -0,0 +1,73 @@
+import os
+from collections import deque
+from itertools import repeat
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from password_core import (
+    STREAM_CHUNK_SIZE,
+    build_alphabet,
+    check_chunk_size,
+    check_length,
+    random_characters,
+)
+
+
+def _chunk_sizes(count, chunk_size):
+    full, rest = divmod(count, chunk_size)
+    yield from repeat(chunk_size, full)
+    if rest:
+        yield rest
+
+
+def _generate_chunk(alphabet, count):
+    # Runs in a worker process. random_characters reads straight from the
+    # kernel CSPRNG with os.urandom, so every worker draws its own
+    # independent stream and there is no user-space generator state to
+    # duplicate on fork.
+    # A single string is returned because it pickles far cheaper than a list.
+    return random_characters(alphabet, count)
+
+
+def iter_parallel_chunks(count, length, letters=True, digits=True, symbols=True,
+                         workers=None, ordered=True, chunk_size=STREAM_CHUNK_SIZE):
+    check_length(length)
+    check_chunk_size(chunk_size)
+    alphabet = build_alphabet(letters, digits, symbols)
+
+    if count < 0:
+        raise ValueError("Password count cannot be negative.")
+
+    workers = workers or os.cpu_count() or 1
+    sizes = _chunk_sizes(count, chunk_size)
+    # Only a couple of chunks per worker are in flight at any time, so memory
+    # stays bounded when the consumer is slower than the pool.
+    window = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def submit():
+            size = next(sizes, None)
+            if size is not None:
+                pending.append(pool.submit(_generate_chunk, alphabet, size * length))
+
+        pending = deque()
+        for _ in range(window):
+            submit()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(future)
+            submit()
+            text = future.result()
+            yield [text[start:start + length] for start in range(0, len(text), length)]
+
+
+def generate_parallel(count, length, letters=True, digits=True, symbols=True,
+                      workers=None, ordered=True, chunk_size=STREAM_CHUNK_SIZE):
+    passwords = []
+    for chunk in iter_parallel_chunks(count, length, letters, digits, symbols,
+                                      workers, ordered, chunk_size):
+        passwords.extend(chunk)
+    return passwords
@@ -0,0 +1,139 @@
+import secrets
+import string
+from bisect import bisect_right
+from functools import lru_cache
+from math import factorial
+
+from password_core import SYMBOLS, check_length, random_characters
+
+CLASS_SETS = {
+    "letters": string.ascii_letters,
+    "digits": string.digits,
+    "symbols": SYMBOLS,
+}
+
+# Random bytes buffered per refill when drawing sort keys and compositions
+_BUFFER_SIZE = 64 * 1024
+
+
+class _RandomBuffer:
+    def __init__(self):
+        self.data = b""
+        self.offset = 0
+
+    def take(self, size):
+        if self.offset + size > len(self.data):
+            self.data = self.data[self.offset:] + secrets.token_bytes(max(size, _BUFFER_SIZE))
+            self.offset = 0
+        start = self.offset
+        self.offset += size
+        return self.data[start:self.offset]
+
+    def below(self, limit):
+        bits = (limit - 1).bit_length()
+        size = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        while True:
+            value = int.from_bytes(self.take(size), "little") & mask
+            if value < limit:
+                return value
+
+
+def resolve_minimums(letters=True, digits=True, symbols=True, minimums=None):
+    selected = {"letters": letters, "digits": digits, "symbols": symbols}
+    if not any(selected.values()):
+        raise ValueError("Please select at least one character type.")
+
+    if minimums is None:
+        minimums = {name: 1 for name, enabled in selected.items() if enabled}
+
+    for name, required in minimums.items():
+        if name not in CLASS_SETS:
+            raise ValueError(f"Unknown character class: {name}")
+        if required < 0:
+            raise ValueError("Minimum counts cannot be negative.")
+        if required and not selected[name]:
+            raise ValueError(f"A minimum is set for {name}, but {name} are not selected.")
+
+    return tuple(
+        (name, minimums.get(name, 0)) for name, enabled in selected.items() if enabled
+    )
+
+
+@lru_cache(maxsize=None)
+def _compositions(length, classes):
+    # Every way of splitting `length` characters between the selected
+    # classes that meets the minimums, weighted by how many distinct
+    # passwords have exactly that split:
+    #   length! / (c1! c2! ...) * size1**c1 * size2**c2 ...
+    # Sampling a split with these weights and then filling and shuffling it
+    # uniformly gives every policy-compliant password the same probability.
+    sizes = [len(CLASS_SETS[name]) for name, _ in classes]
+    minimums = [required for _, required in classes]
+    splits = []
+    cumulative = []
+    total = 0
+
+    def extend(prefix, remaining):
+        nonlocal total
+        index = len(prefix)
+        if index == len(classes) - 1:
+            if remaining < minimums[index]:
+                return
+            split = prefix + (remaining,)
+            weight = factorial(length)
+            for count, size in zip(split, sizes):
+                weight = weight // factorial(count) * size ** count
+            total += weight
+            splits.append(split)
+            cumulative.append(total)
+            return
+        for count in range(minimums[index], remaining + 1):
+            extend(prefix + (count,), remaining - count)
+
+    extend((), length)
+    return splits, cumulative, total
+
+
+def generate_policy_passwords(count, length, letters=True, digits=True, symbols=True,
+                              minimums=None):
+    check_length(length)
+    classes = resolve_minimums(letters, digits, symbols, minimums)
+
+    if sum(required for _, required in classes) > length:
+        raise ValueError("Minimum counts exceed the password length.")
+
+    splits, cumulative, total = _compositions(length, classes)
+    buffer = _RandomBuffer()
+
+    chosen = [splits[bisect_right(cumulative, buffer.below(total))] for _ in range(count)]
+
+    # Draw all characters of each class for the whole batch in one call
+    pools = []
+    for index, (name, _) in enumerate(classes):
+        needed = sum(split[index] for split in chosen)
+        pools.append(random_characters(CLASS_SETS[name], needed))
+
+    offsets = [0] * len(classes)
+    key_bytes = 4 * length
+    passwords = []
+
+    for split in chosen:
+        parts = []
+        for index, amount in enumerate(split):
+            start = offsets[index]
+            parts.append(pools[index][start:start + amount])
+            offsets[index] = start + amount
+        characters = "".join(parts)
+
+        # Shuffle by sorting on random 32-bit keys. Keys are redrawn on a tie
+        # (about one password in ten million) so every order stays exactly
+        # equally likely.
+        while True:
+            keys = memoryview(buffer.take(key_bytes)).cast("I").tolist()
+            by_key = dict(zip(keys, characters))
+            if len(by_key) == length:
+                break
+        passwords.append("".join(map(by_key.__getitem__, sorted(by_key))))
+
+    return passwords
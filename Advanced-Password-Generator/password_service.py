@@ -0,0 +1,352 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from password_core import (
+    build_alphabet,
+    calculate_entropy,
+    check_length,
+    generate_passwords,
+    score_passwords,
+    strength_from_entropy,
+)
+
+# Batches at or above this many passwords (or scores) go to the worker pool
+OFFLOAD_THRESHOLD = 10_000
+MAX_BATCH = 1_000_000
+MAX_BODY_BYTES = 64 * 1024 * 1024
+# Request bodies at or above this size are parsed in the worker pool too
+OFFLOAD_BODY_BYTES = 1024 * 1024
+
+# Latencies kept per endpoint for the percentile figures in /metrics
+LATENCY_WINDOW = 10_000
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+    def __reduce__(self):
+        # Raised inside pool workers, so it has to survive pickling
+        return HttpError, (self.status, str(self))
+
+
+class Metrics:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = {}
+        self.errors = {}
+        self.passwords_generated = 0
+        self.passwords_scored = 0
+        self.latencies = {}
+
+    def record(self, endpoint, status, elapsed):
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        if status >= 400:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        self.latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(elapsed)
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        latency = {}
+        for endpoint, samples in self.latencies.items():
+            ordered = sorted(samples)
+            latency[endpoint] = {
+                f"p{point}_ms": round(ordered[min(len(ordered) - 1, len(ordered) * point // 100)] * 1000, 3)
+                for point in (50, 90, 99)
+            }
+            latency[endpoint]["max_ms"] = round(ordered[-1] * 1000, 3)
+        return {
+            "uptime_sec": round(uptime, 1),
+            "requests": self.requests,
+            "errors": self.errors,
+            "passwords_generated": self.passwords_generated,
+            "passwords_scored": self.passwords_scored,
+            "generated_per_sec": round(self.passwords_generated / uptime, 1) if uptime else 0.0,
+            "latency": latency,
+        }
+
+
+def _flag(value, default=True):
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+def _int(value, name, default):
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"{name} must be an integer.")
+
+
+def _generation_options(params):
+    length = _int(params.get("length"), "length", 16)
+    classes = (
+        _flag(params.get("letters")),
+        _flag(params.get("digits")),
+        _flag(params.get("symbols")),
+    )
+    try:
+        check_length(length)
+        build_alphabet(*classes)
+    except ValueError as err:
+        raise HttpError(400, str(err))
+    return length, classes
+
+
+def _batch_payload(count, length, classes):
+    passwords = generate_passwords(count, length, *classes)
+    return {
+        "count": count,
+        "passwords": [
+            {"password": password, "entropy": entropy, "strength": label}
+            for password, (entropy, label) in zip(passwords, score_passwords(passwords))
+        ],
+    }
+
+
+def _score_payload(passwords):
+    return {
+        "count": len(passwords),
+        "scores": [
+            {"entropy": entropy, "strength": label}
+            for entropy, label in score_passwords(passwords)
+        ],
+    }
+
+
+def _json_body(raw):
+    if not raw:
+        return {}
+    try:
+        body = json.loads(raw)
+    except ValueError:
+        raise HttpError(400, "Request body must be JSON.")
+    if not isinstance(body, dict):
+        raise HttpError(400, "Request body must be a JSON object.")
+    return body
+
+
+def _passwords_to_score(body):
+    passwords = body.get("passwords")
+    if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+        raise HttpError(400, "Provide 'passwords' as a JSON list of strings.")
+    if len(passwords) > MAX_BATCH:
+        raise HttpError(400, f"At most {MAX_BATCH} passwords can be scored at once.")
+    return passwords
+
+
+def _score_body(raw):
+    # Runs in a worker process: parsing tens of megabytes of JSON takes as
+    # long as scoring it, and handing the parsed list back would cost as much
+    # again in unpickling, so the whole request is done here.
+    passwords = _passwords_to_score(_json_body(raw))
+    return len(passwords), _encoded(_score_payload, passwords)
+
+
+def _encoded(func, *args):
+    # Runs in a worker process: serialising a large response is as costly as
+    # building it, so the event loop only receives the finished bytes.
+    return json.dumps(func(*args)).encode("utf-8")
+
+
+class PasswordService:
+    def __init__(self, workers=None, offload_threshold=OFFLOAD_THRESHOLD):
+        self.metrics = Metrics()
+        self.offload_threshold = offload_threshold
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+    async def _run(self, size, func, *args):
+        # Large jobs run in the process pool so the event loop keeps serving
+        # other connections; small ones are cheaper to do inline.
+        if size >= self.offload_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, _encoded, func, *args)
+        return func(*args)
+
+    async def password(self, params, raw):
+        length, classes = _generation_options(params)
+        password = generate_passwords(1, length, *classes)[0]
+        entropy = calculate_entropy(password)
+        self.metrics.passwords_generated += 1
+        return {
+            "password": password,
+            "entropy": entropy,
+            "strength": strength_from_entropy(entropy)[0],
+        }
+
+    async def batch(self, params, raw):
+        # Only /score takes large bodies; anything this big here is not options
+        if len(raw) >= OFFLOAD_BODY_BYTES:
+            raise HttpError(413, "Request body is too large.")
+        params = {**params, **_json_body(raw)}
+        count = _int(params.get("count"), "count", 1)
+        if not 1 <= count <= MAX_BATCH:
+            raise HttpError(400, f"count must be between 1 and {MAX_BATCH}.")
+        length, classes = _generation_options(params)
+
+        payload = await self._run(count, _batch_payload, count, length, classes)
+        self.metrics.passwords_generated += count
+        return payload
+
+    async def score(self, params, raw):
+        if len(raw) >= OFFLOAD_BODY_BYTES:
+            loop = asyncio.get_running_loop()
+            count, payload = await loop.run_in_executor(self.pool, _score_body, raw)
+        else:
+            passwords = _passwords_to_score(_json_body(raw))
+            count = len(passwords)
+            payload = await self._run(count, _score_payload, passwords)
+        self.metrics.passwords_scored += count
+        return payload
+
+    async def metrics_view(self, params, raw):
+        return self.metrics.snapshot()
+
+    def routes(self):
+        return {
+            ("GET", "/password"): self.password,
+            ("GET", "/batch"): self.batch,
+            ("POST", "/batch"): self.batch,
+            ("POST", "/score"): self.score,
+            ("GET", "/metrics"): self.metrics_view,
+        }
+
+    async def handle(self, reader, writer):
+        routes = self.routes()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                endpoint = "invalid"
+                keep_alive = True
+                # Until the headers and body have been read, the rest of the
+                # connection cannot be trusted to start at a request line
+                complete = False
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    headers = await _read_headers(reader)
+                    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                    url = urlsplit(target)
+                    raw = await _read_body(reader, headers)
+                    complete = True
+
+                    handler = routes.get((method, url.path))
+                    if handler is None:
+                        known = any(path == url.path for _, path in routes)
+                        raise HttpError(405 if known else 404, f"No route for {method} {url.path}")
+                    # Only known paths become metric keys, so stray requests
+                    # cannot grow the counters without bound
+                    endpoint = url.path
+
+                    params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                    status, payload = 200, await handler(params, raw)
+                except HttpError as err:
+                    status, payload = err.status, {"error": str(err)}
+                except ValueError:
+                    status, payload = 400, {"error": "Malformed request."}
+                except Exception as err:
+                    status, payload = 500, {"error": f"Something went wrong: {err}"}
+
+                keep_alive = keep_alive and complete
+                await _write_json(writer, status, payload, keep_alive)
+                self.metrics.record(endpoint, status, time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def _read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_body(reader, headers):
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, "Request body is too large.")
+    if not length:
+        return b""
+    return await reader.readexactly(length)
+
+
+async def _write_json(writer, status, payload, keep_alive):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Error')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    ).encode("latin-1")
+    writer.write(head + body)
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8750, unix_socket=None, workers=None):
+    service = PasswordService(workers)
+    if unix_socket:
+        server = await asyncio.start_unix_server(service.handle, path=unix_socket)
+        where = unix_socket
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        where = f"http://{host}:{port}"
+
+    print(f"Password service listening on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local password-issuing service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8750)
+    parser.add_argument("--unix-socket", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, help="processes for large batches (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_socket, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
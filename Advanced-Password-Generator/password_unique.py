@@ -0,0 +1,140 @@
+import hashlib
+import os
+from array import array
+
+from password_core import (
+    STREAM_CHUNK_SIZE,
+    build_alphabet,
+    check_chunk_size,
+    check_length,
+    random_characters,
+)
+
+# The table is grown once it is this full; linear probing stays fast below it
+MAX_LOAD = 0.7
+
+
+# Open-addressing set of 8-byte truncated BLAKE2b digests. Each entry costs
+# 8 bytes in an array('Q') instead of a ~60-byte Python string plus set
+# overhead. Zero marks an empty slot, so a digest of zero is stored as one.
+# Digests are keyed with a random per-set key, so a 64-bit collision between
+# two different passwords (about n**2 / 2**65) cannot be provoked and only
+# costs one extra draw.
+class DigestSet:
+    def __init__(self, capacity=1024):
+        # Sized exactly for the expected count rather than rounded up to a
+        # power of two, which could double the memory for large batches
+        self._slots = array("Q", bytes(8 * (int(capacity / MAX_LOAD) + 1)))
+        self._key = os.urandom(16)
+        self.count = 0
+        self.rejected = 0
+
+    def _digest(self, value):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8, key=self._key).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def add(self, value):
+        if not self._insert(self._slots, self._digest(value)):
+            self.rejected += 1
+            return False
+
+        self.count += 1
+        if self.count > MAX_LOAD * len(self._slots):
+            self._grow()
+        return True
+
+    @staticmethod
+    def _insert(slots, digest):
+        size = len(slots)
+        index = digest % size
+        while True:
+            current = slots[index]
+            if current == digest:
+                return False
+            if not current:
+                slots[index] = digest
+                return True
+            index += 1
+            if index == size:
+                index = 0
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        for digest in old:
+            if digest:
+                self._insert(self._slots, digest)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def slots(self):
+        return len(self._slots)
+
+    @property
+    def nbytes(self):
+        return self._slots.itemsize * len(self._slots)
+
+    def stats(self):
+        return {
+            "unique": self.count,
+            "duplicates_rejected": self.rejected,
+            "table_slots": self.slots,
+            "table_bytes": self.nbytes,
+            "bytes_per_password": round(self.nbytes / max(self.count, 1), 1),
+        }
+
+
+def check_unique_request(count, length, letters=True, digits=True, symbols=True,
+                         chunk_size=STREAM_CHUNK_SIZE):
+    # Run before sizing a DigestSet for `count`, so an impossible request
+    # fails here instead of with MemoryError. Returns the alphabet.
+    check_length(length)
+    check_chunk_size(chunk_size)
+    alphabet = build_alphabet(letters, digits, symbols)
+
+    if count < 0:
+        raise ValueError("Password count cannot be negative.")
+    # Random draws slow down sharply as the keyspace fills up (the last few
+    # passwords of a full keyspace take as many draws as the rest put
+    # together), so at most half of it may be requested
+    if count > len(alphabet) ** length // 2:
+        raise ValueError(
+            "Too few distinct passwords exist for this length and character set; "
+            "unique output may use at most half of them."
+        )
+    return alphabet
+
+
+def iter_unique_chunks(count, length, letters=True, digits=True, symbols=True,
+                       chunk_size=STREAM_CHUNK_SIZE, seen=None):
+    alphabet = check_unique_request(count, length, letters, digits, symbols, chunk_size)
+
+    if seen is None:
+        seen = DigestSet(count)
+    add = seen.add
+    remaining = count
+
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        text = random_characters(alphabet, size * length)
+        chunk = [
+            password
+            for password in (text[start:start + length] for start in range(0, len(text), length))
+            if add(password)
+        ]
+        remaining -= len(chunk)
+        # A draw that was all duplicates has nothing to hand on
+        if chunk:
+            yield chunk
+
+
+def generate_unique_passwords(count, length, letters=True, digits=True, symbols=True,
+                              chunk_size=STREAM_CHUNK_SIZE):
+    check_unique_request(count, length, letters, digits, symbols, chunk_size)
+    seen = DigestSet(count)
+    passwords = []
+    for chunk in iter_unique_chunks(count, length, letters, digits, symbols, chunk_size, seen):
+        passwords.extend(chunk)
+    return passwords, seen.stats()
@@ -0,0 +1,555 @@
+# Generated by build_pattern_data.py -- do not edit by hand.
+
+WORD_RANKS = {'password': 1,
+ '123456': 2,
+ '12345678': 3,
+ 'qwerty': 4,
+ '123456789': 5,
+ '12345': 6,
+ '1234': 7,
+ '111111': 8,
+ '1234567': 9,
+ 'dragon': 10,
+ '123123': 11,
+ 'baseball': 12,
+ 'abc123': 13,
+ 'football': 14,
+ 'monkey': 15,
+ 'letmein': 16,
+ '696969': 17,
+ 'shadow': 18,
+ 'master': 19,
+ '666666': 20,
+ 'qwertyuiop': 21,
+ '123321': 22,
+ 'mustang': 23,
+ '1234567890': 24,
+ 'michael': 25,
+ '654321': 26,
+ 'superman': 27,
+ '1qaz2wsx': 28,
+ '7777777': 29,
+ '121212': 30,
+ '000000': 31,
+ 'qazwsx': 32,
+ '123qwe': 33,
+ 'killer': 34,
+ 'trustno1': 35,
+ 'jordan': 36,
+ 'jennifer': 37,
+ 'zxcvbnm': 38,
+ 'asdfgh': 39,
+ 'hunter': 40,
+ 'buster': 41,
+ 'soccer': 42,
+ 'harley': 43,
+ 'batman': 44,
+ 'andrew': 45,
+ 'tigger': 46,
+ 'sunshine': 47,
+ 'iloveyou': 48,
+ '2000': 49,
+ 'charlie': 50,
+ 'robert': 51,
+ 'thomas': 52,
+ 'hockey': 53,
+ 'ranger': 54,
+ 'daniel': 55,
+ 'starwars': 56,
+ 'klaster': 57,
+ '112233': 58,
+ 'george': 59,
+ 'computer': 60,
+ 'michelle': 61,
+ 'jessica': 62,
+ 'pepper': 63,
+ '1111': 64,
+ 'zxcvbn': 65,
+ '555555': 66,
+ '11111111': 67,
+ '131313': 68,
+ 'freedom': 69,
+ '777777': 70,
+ 'pass': 71,
+ 'maggie': 72,
+ '159753': 73,
+ 'aaaaaa': 74,
+ 'ginger': 75,
+ 'princess': 76,
+ 'joshua': 77,
+ 'cheese': 78,
+ 'amanda': 79,
+ 'summer': 80,
+ 'love': 81,
+ 'ashley': 82,
+ 'nicole': 83,
+ 'chelsea': 84,
+ 'biteme': 85,
+ 'matthew': 86,
+ 'access': 87,
+ 'yankees': 88,
+ '987654321': 89,
+ 'dallas': 90,
+ 'austin': 91,
+ 'thunder': 92,
+ 'taylor': 93,
+ 'matrix': 94,
+ 'mobilemail': 95,
+ 'mom': 96,
+ 'monitor': 97,
+ 'monitoring': 98,
+ 'montana': 99,
+ 'moon': 100,
+ 'moscow': 101,
+ 'admin': 102,
+ 'welcome': 103,
+ 'login': 104,
+ 'abc': 105,
+ 'secret': 106,
+ 'hello': 107,
+ 'whatever': 108,
+ 'flower': 109,
+ 'passw0rd': 110,
+ 'password1': 111,
+ 'qwerty123': 112,
+ 'football1': 113,
+ 'baseball1': 114,
+ 'welcome1': 115,
+ 'admin123': 116,
+ 'letmein1': 117,
+ 'lovely': 118,
+ 'samsung': 119,
+ 'nothing': 120,
+ 'orange': 121,
+ 'apple': 122,
+ 'banana': 123,
+ 'cookie': 124,
+ 'coffee': 125,
+ 'chocolate': 126,
+ 'purple': 127,
+ 'silver': 128,
+ 'golden': 129,
+ 'diamond': 130,
+ 'angel': 131,
+ 'angels': 132,
+ 'heaven': 133,
+ 'forever': 134,
+ 'friends': 135,
+ 'family': 136,
+ 'happy': 137,
+ 'smile': 138,
+ 'lucky': 139,
+ 'money': 140,
+ 'secret1': 141,
+ 'winter': 142,
+ 'spring': 143,
+ 'autumn': 144,
+ 'march': 145,
+ 'april': 146,
+ 'june': 147,
+ 'july': 148,
+ 'august': 149,
+ 'october': 150,
+ 'november': 151,
+ 'december': 152,
+ 'january': 153,
+ 'february': 154,
+ 'september': 155,
+ 'monday': 156,
+ 'friday': 157,
+ 'sunday': 158,
+ 'dolphin': 159,
+ 'tiger': 160,
+ 'lion': 161,
+ 'eagle': 162,
+ 'falcon': 163,
+ 'phoenix': 164,
+ 'wizard': 165,
+ 'magic': 166,
+ 'ninja': 167,
+ 'pirate': 168,
+ 'knight': 169,
+ 'warrior': 170,
+ 'hero': 171,
+ 'legend': 172,
+ 'dream': 173,
+ 'dreams': 174,
+ 'music': 175,
+ 'guitar': 176,
+ 'rock': 177,
+ 'star': 178,
+ 'stars': 179,
+ 'sky': 180,
+ 'ocean': 181,
+ 'river': 182,
+ 'mountain': 183,
+ 'forest': 184,
+ 'garden': 185,
+ 'house': 186,
+ 'home': 187,
+ 'school': 188,
+ 'student': 189,
+ 'teacher': 190,
+ 'doctor': 191,
+ 'nurse': 192,
+ 'office': 193,
+ 'company': 194,
+ 'business': 195,
+ 'internet': 196,
+ 'google': 197,
+ 'facebook': 198,
+ 'twitter': 199,
+ 'yahoo': 200,
+ 'hotmail': 201,
+ 'gmail': 202,
+ 'microsoft': 203,
+ 'windows': 204,
+ 'linux': 205,
+ 'server': 206,
+ 'system': 207,
+ 'network': 208,
+ 'security': 209,
+ 'database': 210,
+ 'oracle': 211,
+ 'mysql': 212,
+ 'root': 213,
+ 'toor': 214,
+ 'user': 215,
+ 'guest': 216,
+ 'test': 217,
+ 'test123': 218,
+ 'demo': 219,
+ 'default': 220,
+ 'changeme': 221,
+ 'temp': 222,
+ 'temporary': 223,
+ 'private': 224,
+ 'public': 225,
+ 'qwer': 226,
+ 'asdf': 227,
+ 'zxcv': 228,
+ 'qazxsw': 229,
+ 'asdfghjkl': 230,
+ '1q2w3e4r': 231,
+ '1q2w3e': 232,
+ 'q1w2e3r4': 233,
+ 'abcdef': 234,
+ 'abcd1234': 235,
+ 'red': 236,
+ 'blue': 237,
+ 'green': 238,
+ 'yellow': 239,
+ 'black': 240,
+ 'white': 241,
+ 'brown': 242,
+ 'pink': 243,
+ 'cat': 244,
+ 'dog': 245,
+ 'horse': 246,
+ 'bird': 247,
+ 'fish': 248,
+ 'bear': 249,
+ 'wolf': 250,
+ 'fox': 251,
+ 'snake': 252,
+ 'spider': 253,
+ 'china': 254,
+ 'india': 255,
+ 'london': 256,
+ 'paris': 257,
+ 'berlin': 258,
+ 'america': 259,
+ 'canada': 260,
+ 'mexico': 261,
+ 'brazil': 262,
+ 'england': 263,
+ 'france': 264,
+ 'germany': 265,
+ 'italy': 266,
+ 'spain': 267,
+ 'japan': 268,
+ 'korea': 269,
+ 'russia': 270,
+ 'john': 271,
+ 'david': 272,
+ 'james': 273,
+ 'william': 274,
+ 'richard': 275,
+ 'joseph': 276,
+ 'chris': 277,
+ 'mark': 278,
+ 'paul': 279,
+ 'steven': 280,
+ 'kevin': 281,
+ 'brian': 282,
+ 'mary': 283,
+ 'patricia': 284,
+ 'linda': 285,
+ 'barbara': 286,
+ 'elizabeth': 287,
+ 'susan': 288,
+ 'sarah': 289,
+ 'karen': 290,
+ 'lisa': 291,
+ 'anna': 292,
+ 'emma': 293,
+ 'olivia': 294,
+ 'sophia': 295}
+
+# Every prefix of a dictionary word, so scans can stop early
+WORD_PREFIXES = frozenset(['0', '00', '000', '0000', '00000', '000000', '1', '11', '111', '1111', '11111', '111111',
+ '1111111', '11111111', '112', '1122', '11223', '112233', '12', '121', '1212', '12121', '121212',
+ '123', '1231', '12312', '123123', '1233', '12332', '123321', '1234', '12345', '123456', '1234567',
+ '12345678', '123456789', '1234567890', '123q', '123qw', '123qwe', '13', '131', '1313', '13131',
+ '131313', '15', '159', '1597', '15975', '159753', '1q', '1q2', '1q2w', '1q2w3', '1q2w3e',
+ '1q2w3e4', '1q2w3e4r', '1qa', '1qaz', '1qaz2', '1qaz2w', '1qaz2ws', '1qaz2wsx', '2', '20', '200',
+ '2000', '5', '55', '555', '5555', '55555', '555555', '6', '65', '654', '6543', '65432', '654321',
+ '66', '666', '6666', '66666', '666666', '69', '696', '6969', '69696', '696969', '7', '77', '777',
+ '7777', '77777', '777777', '7777777', '9', '98', '987', '9876', '98765', '987654', '9876543',
+ '98765432', '987654321', 'a', 'aa', 'aaa', 'aaaa', 'aaaaa', 'aaaaaa', 'ab', 'abc', 'abc1', 'abc12',
+ 'abc123', 'abcd', 'abcd1', 'abcd12', 'abcd123', 'abcd1234', 'abcde', 'abcdef', 'ac', 'acc', 'acce',
+ 'acces', 'access', 'ad', 'adm', 'admi', 'admin', 'admin1', 'admin12', 'admin123', 'am', 'ama',
+ 'aman', 'amand', 'amanda', 'ame', 'amer', 'ameri', 'americ', 'america', 'an', 'and', 'andr',
+ 'andre', 'andrew', 'ang', 'ange', 'angel', 'angels', 'ann', 'anna', 'ap', 'app', 'appl', 'apple',
+ 'apr', 'apri', 'april', 'as', 'asd', 'asdf', 'asdfg', 'asdfgh', 'asdfghj', 'asdfghjk', 'asdfghjkl',
+ 'ash', 'ashl', 'ashle', 'ashley', 'au', 'aug', 'augu', 'augus', 'august', 'aus', 'aust', 'austi',
+ 'austin', 'aut', 'autu', 'autum', 'autumn', 'b', 'ba', 'ban', 'bana', 'banan', 'banana', 'bar',
+ 'barb', 'barba', 'barbar', 'barbara', 'bas', 'base', 'baseb', 'baseba', 'basebal', 'baseball',
+ 'baseball1', 'bat', 'batm', 'batma', 'batman', 'be', 'bea', 'bear', 'ber', 'berl', 'berli',
+ 'berlin', 'bi', 'bir', 'bird', 'bit', 'bite', 'bitem', 'biteme', 'bl', 'bla', 'blac', 'black',
+ 'blu', 'blue', 'br', 'bra', 'braz', 'brazi', 'brazil', 'bri', 'bria', 'brian', 'bro', 'brow',
+ 'brown', 'bu', 'bus', 'busi', 'busin', 'busine', 'busines', 'business', 'bust', 'buste', 'buster',
+ 'c', 'ca', 'can', 'cana', 'canad', 'canada', 'cat', 'ch', 'cha', 'chan', 'chang', 'change',
+ 'changem', 'changeme', 'char', 'charl', 'charli', 'charlie', 'che', 'chee', 'chees', 'cheese',
+ 'chel', 'chels', 'chelse', 'chelsea', 'chi', 'chin', 'china', 'cho', 'choc', 'choco', 'chocol',
+ 'chocola', 'chocolat', 'chocolate', 'chr', 'chri', 'chris', 'co', 'cof', 'coff', 'coffe', 'coffee',
+ 'com', 'comp', 'compa', 'compan', 'company', 'compu', 'comput', 'compute', 'computer', 'coo',
+ 'cook', 'cooki', 'cookie', 'd', 'da', 'dal', 'dall', 'dalla', 'dallas', 'dan', 'dani', 'danie',
+ 'daniel', 'dat', 'data', 'datab', 'databa', 'databas', 'database', 'dav', 'davi', 'david', 'de',
+ 'dec', 'dece', 'decem', 'decemb', 'decembe', 'december', 'def', 'defa', 'defau', 'defaul',
+ 'default', 'dem', 'demo', 'di', 'dia', 'diam', 'diamo', 'diamon', 'diamond', 'do', 'doc', 'doct',
+ 'docto', 'doctor', 'dog', 'dol', 'dolp', 'dolph', 'dolphi', 'dolphin', 'dr', 'dra', 'drag',
+ 'drago', 'dragon', 'dre', 'drea', 'dream', 'dreams', 'e', 'ea', 'eag', 'eagl', 'eagle', 'el',
+ 'eli', 'eliz', 'eliza', 'elizab', 'elizabe', 'elizabet', 'elizabeth', 'em', 'emm', 'emma', 'en',
+ 'eng', 'engl', 'engla', 'englan', 'england', 'f', 'fa', 'fac', 'face', 'faceb', 'facebo',
+ 'faceboo', 'facebook', 'fal', 'falc', 'falco', 'falcon', 'fam', 'fami', 'famil', 'family', 'fe',
+ 'feb', 'febr', 'febru', 'februa', 'februar', 'february', 'fi', 'fis', 'fish', 'fl', 'flo', 'flow',
+ 'flowe', 'flower', 'fo', 'foo', 'foot', 'footb', 'footba', 'footbal', 'football', 'football1',
+ 'for', 'fore', 'fores', 'forest', 'forev', 'foreve', 'forever', 'fox', 'fr', 'fra', 'fran',
+ 'franc', 'france', 'fre', 'free', 'freed', 'freedo', 'freedom', 'fri', 'frid', 'frida', 'friday',
+ 'frie', 'frien', 'friend', 'friends', 'g', 'ga', 'gar', 'gard', 'garde', 'garden', 'ge', 'geo',
+ 'geor', 'georg', 'george', 'ger', 'germ', 'germa', 'german', 'germany', 'gi', 'gin', 'ging',
+ 'ginge', 'ginger', 'gm', 'gma', 'gmai', 'gmail', 'go', 'gol', 'gold', 'golde', 'golden', 'goo',
+ 'goog', 'googl', 'google', 'gr', 'gre', 'gree', 'green', 'gu', 'gue', 'gues', 'guest', 'gui',
+ 'guit', 'guita', 'guitar', 'h', 'ha', 'hap', 'happ', 'happy', 'har', 'harl', 'harle', 'harley',
+ 'he', 'hea', 'heav', 'heave', 'heaven', 'hel', 'hell', 'hello', 'her', 'hero', 'ho', 'hoc', 'hock',
+ 'hocke', 'hockey', 'hom', 'home', 'hor', 'hors', 'horse', 'hot', 'hotm', 'hotma', 'hotmai',
+ 'hotmail', 'hou', 'hous', 'house', 'hu', 'hun', 'hunt', 'hunte', 'hunter', 'i', 'il', 'ilo',
+ 'ilov', 'ilove', 'ilovey', 'iloveyo', 'iloveyou', 'in', 'ind', 'indi', 'india', 'int', 'inte',
+ 'inter', 'intern', 'interne', 'internet', 'it', 'ita', 'ital', 'italy', 'j', 'ja', 'jam', 'jame',
+ 'james', 'jan', 'janu', 'janua', 'januar', 'january', 'jap', 'japa', 'japan', 'je', 'jen', 'jenn',
+ 'jenni', 'jennif', 'jennife', 'jennifer', 'jes', 'jess', 'jessi', 'jessic', 'jessica', 'jo', 'joh',
+ 'john', 'jor', 'jord', 'jorda', 'jordan', 'jos', 'jose', 'josep', 'joseph', 'josh', 'joshu',
+ 'joshua', 'ju', 'jul', 'july', 'jun', 'june', 'k', 'ka', 'kar', 'kare', 'karen', 'ke', 'kev',
+ 'kevi', 'kevin', 'ki', 'kil', 'kill', 'kille', 'killer', 'kl', 'kla', 'klas', 'klast', 'klaste',
+ 'klaster', 'kn', 'kni', 'knig', 'knigh', 'knight', 'ko', 'kor', 'kore', 'korea', 'l', 'le', 'leg',
+ 'lege', 'legen', 'legend', 'let', 'letm', 'letme', 'letmei', 'letmein', 'letmein1', 'li', 'lin',
+ 'lind', 'linda', 'linu', 'linux', 'lio', 'lion', 'lis', 'lisa', 'lo', 'log', 'logi', 'login',
+ 'lon', 'lond', 'londo', 'london', 'lov', 'love', 'lovel', 'lovely', 'lu', 'luc', 'luck', 'lucky',
+ 'm', 'ma', 'mag', 'magg', 'maggi', 'maggie', 'magi', 'magic', 'mar', 'marc', 'march', 'mark',
+ 'mary', 'mas', 'mast', 'maste', 'master', 'mat', 'matr', 'matri', 'matrix', 'matt', 'matth',
+ 'matthe', 'matthew', 'me', 'mex', 'mexi', 'mexic', 'mexico', 'mi', 'mic', 'mich', 'micha',
+ 'michae', 'michael', 'miche', 'michel', 'michell', 'michelle', 'micr', 'micro', 'micros',
+ 'microso', 'microsof', 'microsoft', 'mo', 'mob', 'mobi', 'mobil', 'mobile', 'mobilem', 'mobilema',
+ 'mobilemai', 'mobilemail', 'mom', 'mon', 'mond', 'monda', 'monday', 'mone', 'money', 'moni',
+ 'monit', 'monito', 'monitor', 'monitori', 'monitorin', 'monitoring', 'monk', 'monke', 'monkey',
+ 'mont', 'monta', 'montan', 'montana', 'moo', 'moon', 'mos', 'mosc', 'mosco', 'moscow', 'mou',
+ 'moun', 'mount', 'mounta', 'mountai', 'mountain', 'mu', 'mus', 'musi', 'music', 'must', 'musta',
+ 'mustan', 'mustang', 'my', 'mys', 'mysq', 'mysql', 'n', 'ne', 'net', 'netw', 'netwo', 'networ',
+ 'network', 'ni', 'nic', 'nico', 'nicol', 'nicole', 'nin', 'ninj', 'ninja', 'no', 'not', 'noth',
+ 'nothi', 'nothin', 'nothing', 'nov', 'nove', 'novem', 'novemb', 'novembe', 'november', 'nu', 'nur',
+ 'nurs', 'nurse', 'o', 'oc', 'oce', 'ocea', 'ocean', 'oct', 'octo', 'octob', 'octobe', 'october',
+ 'of', 'off', 'offi', 'offic', 'office', 'ol', 'oli', 'oliv', 'olivi', 'olivia', 'or', 'ora',
+ 'orac', 'oracl', 'oracle', 'oran', 'orang', 'orange', 'p', 'pa', 'par', 'pari', 'paris', 'pas',
+ 'pass', 'passw', 'passw0', 'passw0r', 'passw0rd', 'passwo', 'passwor', 'password', 'password1',
+ 'pat', 'patr', 'patri', 'patric', 'patrici', 'patricia', 'pau', 'paul', 'pe', 'pep', 'pepp',
+ 'peppe', 'pepper', 'ph', 'pho', 'phoe', 'phoen', 'phoeni', 'phoenix', 'pi', 'pin', 'pink', 'pir',
+ 'pira', 'pirat', 'pirate', 'pr', 'pri', 'prin', 'princ', 'prince', 'princes', 'princess', 'priv',
+ 'priva', 'privat', 'private', 'pu', 'pub', 'publ', 'publi', 'public', 'pur', 'purp', 'purpl',
+ 'purple', 'q', 'q1', 'q1w', 'q1w2', 'q1w2e', 'q1w2e3', 'q1w2e3r', 'q1w2e3r4', 'qa', 'qaz', 'qazw',
+ 'qazws', 'qazwsx', 'qazx', 'qazxs', 'qazxsw', 'qw', 'qwe', 'qwer', 'qwert', 'qwerty', 'qwerty1',
+ 'qwerty12', 'qwerty123', 'qwertyu', 'qwertyui', 'qwertyuio', 'qwertyuiop', 'r', 'ra', 'ran',
+ 'rang', 'range', 'ranger', 're', 'red', 'ri', 'ric', 'rich', 'richa', 'richar', 'richard', 'riv',
+ 'rive', 'river', 'ro', 'rob', 'robe', 'rober', 'robert', 'roc', 'rock', 'roo', 'root', 'ru', 'rus',
+ 'russ', 'russi', 'russia', 's', 'sa', 'sam', 'sams', 'samsu', 'samsun', 'samsung', 'sar', 'sara',
+ 'sarah', 'sc', 'sch', 'scho', 'schoo', 'school', 'se', 'sec', 'secr', 'secre', 'secret', 'secret1',
+ 'secu', 'secur', 'securi', 'securit', 'security', 'sep', 'sept', 'septe', 'septem', 'septemb',
+ 'septembe', 'september', 'ser', 'serv', 'serve', 'server', 'sh', 'sha', 'shad', 'shado', 'shadow',
+ 'si', 'sil', 'silv', 'silve', 'silver', 'sk', 'sky', 'sm', 'smi', 'smil', 'smile', 'sn', 'sna',
+ 'snak', 'snake', 'so', 'soc', 'socc', 'socce', 'soccer', 'sop', 'soph', 'sophi', 'sophia', 'sp',
+ 'spa', 'spai', 'spain', 'spi', 'spid', 'spide', 'spider', 'spr', 'spri', 'sprin', 'spring', 'st',
+ 'sta', 'star', 'stars', 'starw', 'starwa', 'starwar', 'starwars', 'ste', 'stev', 'steve', 'steven',
+ 'stu', 'stud', 'stude', 'studen', 'student', 'su', 'sum', 'summ', 'summe', 'summer', 'sun', 'sund',
+ 'sunda', 'sunday', 'suns', 'sunsh', 'sunshi', 'sunshin', 'sunshine', 'sup', 'supe', 'super',
+ 'superm', 'superma', 'superman', 'sus', 'susa', 'susan', 'sy', 'sys', 'syst', 'syste', 'system',
+ 't', 'ta', 'tay', 'tayl', 'taylo', 'taylor', 'te', 'tea', 'teac', 'teach', 'teache', 'teacher',
+ 'tem', 'temp', 'tempo', 'tempor', 'tempora', 'temporar', 'temporary', 'tes', 'test', 'test1',
+ 'test12', 'test123', 'th', 'tho', 'thom', 'thoma', 'thomas', 'thu', 'thun', 'thund', 'thunde',
+ 'thunder', 'ti', 'tig', 'tige', 'tiger', 'tigg', 'tigge', 'tigger', 'to', 'too', 'toor', 'tr',
+ 'tru', 'trus', 'trust', 'trustn', 'trustno', 'trustno1', 'tw', 'twi', 'twit', 'twitt', 'twitte',
+ 'twitter', 'u', 'us', 'use', 'user', 'w', 'wa', 'war', 'warr', 'warri', 'warrio', 'warrior', 'we',
+ 'wel', 'welc', 'welco', 'welcom', 'welcome', 'welcome1', 'wh', 'wha', 'what', 'whate', 'whatev',
+ 'whateve', 'whatever', 'whi', 'whit', 'white', 'wi', 'wil', 'will', 'willi', 'willia', 'william',
+ 'win', 'wind', 'windo', 'window', 'windows', 'wint', 'winte', 'winter', 'wiz', 'wiza', 'wizar',
+ 'wizard', 'wo', 'wol', 'wolf', 'y', 'ya', 'yah', 'yaho', 'yahoo', 'yan', 'yank', 'yanke', 'yankee',
+ 'yankees', 'ye', 'yel', 'yell', 'yello', 'yellow', 'z', 'zx', 'zxc', 'zxcv', 'zxcvb', 'zxcvbn',
+ 'zxcvbnm'])
+
+KEYBOARD_ADJACENCY = {"'": ';[]/',
+ ',': 'm.kl',
+ '-': '0=p[',
+ '.': ',/l;',
+ '/': ".;'",
+ '0': '9-op',
+ '1': '`2q',
+ '2': '13qw',
+ '3': '24we',
+ '4': '35er',
+ '5': '46rt',
+ '6': '57ty',
+ '7': '68yu',
+ '8': '79ui',
+ '9': '80io',
+ ';': "l'p[./",
+ '=': '-[]',
+ '[': "p]-=;'",
+ '\\': ']',
+ ']': "[\\='",
+ '`': '1',
+ 'a': 'sqwz',
+ 'b': 'vngh',
+ 'c': 'xvdf',
+ 'd': 'sferxc',
+ 'e': 'wr34sd',
+ 'f': 'dgrtcv',
+ 'g': 'fhtyvb',
+ 'h': 'gjyubn',
+ 'i': 'uo89jk',
+ 'j': 'hkuinm',
+ 'k': 'jliom,',
+ 'l': 'k;op,.',
+ 'm': 'n,jk',
+ 'n': 'bmhj',
+ 'o': 'ip90kl',
+ 'p': 'o[0-l;',
+ 'q': 'w12a',
+ 'r': 'et45df',
+ 's': 'adwezx',
+ 't': 'ry56fg',
+ 'u': 'yi78hj',
+ 'v': 'cbfg',
+ 'w': 'qe23as',
+ 'x': 'zcsd',
+ 'y': 'tu67gh',
+ 'z': 'xas'}
+
+KEYBOARD_POSITIONS = {"'": (2, 11),
+ ',': (3, 8),
+ '-': (0, 11),
+ '.': (3, 9),
+ '/': (3, 10),
+ '0': (0, 10),
+ '1': (0, 1),
+ '2': (0, 2),
+ '3': (0, 3),
+ '4': (0, 4),
+ '5': (0, 5),
+ '6': (0, 6),
+ '7': (0, 7),
+ '8': (0, 8),
+ '9': (0, 9),
+ ';': (2, 10),
+ '=': (0, 12),
+ '[': (1, 11),
+ '\\': (1, 13),
+ ']': (1, 12),
+ '`': (0, 0),
+ 'a': (2, 1),
+ 'b': (3, 5),
+ 'c': (3, 3),
+ 'd': (2, 3),
+ 'e': (1, 3),
+ 'f': (2, 4),
+ 'g': (2, 5),
+ 'h': (2, 6),
+ 'i': (1, 8),
+ 'j': (2, 7),
+ 'k': (2, 8),
+ 'l': (2, 9),
+ 'm': (3, 7),
+ 'n': (3, 6),
+ 'o': (1, 9),
+ 'p': (1, 10),
+ 'q': (1, 1),
+ 'r': (1, 4),
+ 's': (2, 2),
+ 't': (1, 5),
+ 'u': (1, 7),
+ 'v': (3, 4),
+ 'w': (1, 2),
+ 'x': (3, 2),
+ 'y': (1, 6),
+ 'z': (3, 1)}
+
+KEYBOARD_AVERAGE_DEGREE = 4.595744680851064
+
+# str.translate tables
+UNSHIFT = {33: 49,
+ 34: 39,
+ 35: 51,
+ 36: 52,
+ 37: 53,
+ 38: 55,
+ 40: 57,
+ 41: 48,
+ 42: 56,
+ 43: 61,
+ 58: 59,
+ 60: 44,
+ 62: 46,
+ 63: 47,
+ 64: 50,
+ 65: 97,
+ 66: 98,
+ 67: 99,
+ 68: 100,
+ 69: 101,
+ 70: 102,
+ 71: 103,
+ 72: 104,
+ 73: 105,
+ 74: 106,
+ 75: 107,
+ 76: 108,
+ 77: 109,
+ 78: 110,
+ 79: 111,
+ 80: 112,
+ 81: 113,
+ 82: 114,
+ 83: 115,
+ 84: 116,
+ 85: 117,
+ 86: 118,
+ 87: 119,
+ 88: 120,
+ 89: 121,
+ 90: 122,
+ 94: 54,
+ 95: 45,
+ 123: 91,
+ 124: 92,
+ 125: 93,
+ 126: 96}
+
+LEET = {33: 105, 36: 115, 48: 111, 49: 105, 51: 101, 52: 97, 53: 115, 55: 116, 64: 97}
@@ -0,0 +1,263 @@
+import math
+import re
+from functools import lru_cache
+
+from password_core import _POOL_BITS, calculate_entropy, class_mask, strength_from_entropy
+from pattern_data import (
+    KEYBOARD_ADJACENCY,
+    KEYBOARD_AVERAGE_DEGREE,
+    KEYBOARD_POSITIONS,
+    LEET,
+    UNSHIFT,
+    WORD_PREFIXES,
+    WORD_RANKS,
+)
+
+# Distinct passwords whose estimates are kept, so bulk re-scoring is cheap
+CACHE_SIZE = 1 << 16
+
+MIN_MATCH_LENGTH = 3
+
+YEARS = range(1900, 2050)
+YEAR_BITS = math.log2(len(YEARS))
+DATE_BITS = math.log2(len(YEARS) * 12 * 31)
+
+KEYBOARD_START_BITS = math.log2(len(KEYBOARD_ADJACENCY))
+KEYBOARD_TURN_BITS = math.log2(KEYBOARD_AVERAGE_DEGREE)
+
+_SEPARATED_DATE = re.compile(r"\d{1,4}[-/._ ]\d{1,2}[-/._ ]\d{1,4}")
+_DIGIT_RUN = re.compile(r"\d{4,8}")
+
+
+def _case_bits(token):
+    upper = sum(char.isupper() for char in token)
+    lower = sum(char.islower() for char in token)
+    if not upper:
+        return 0.0
+    if not lower or (upper == 1 and token[0].isupper()):
+        return 1.0
+    return math.log2(math.comb(upper + lower, min(upper, lower)))
+
+
+def _scan_words(text, extra, matches, password, reverse=False):
+    size = len(text)
+    for start in range(size):
+        for end in range(start + 1, size + 1):
+            token = text[start:end]
+            if token not in WORD_PREFIXES:
+                break
+            rank = WORD_RANKS.get(token)
+            if rank and end - start >= MIN_MATCH_LENGTH:
+                first, last = (size - end, size - start) if reverse else (start, end)
+                bits = math.log2(rank) + _case_bits(password[first:last]) + extra
+                matches.append((first, last, bits, "dictionary"))
+
+
+def _dictionary_matches(password, lower):
+    matches = []
+    _scan_words(lower, 0.0, matches, password)
+    _scan_words(lower[::-1], 1.0, matches, password, reverse=True)
+
+    plain = lower.translate(LEET)
+    if plain != lower:
+        # Substitutions such as p@ssw0rd add roughly one bit
+        _scan_words(plain, 1.0, matches, password)
+    return matches
+
+
+def _run_matches(password, step_of, bits_of, kind):
+    # Maximal runs where every neighbouring pair satisfies `step_of`, which
+    # also gets the start of the run being extended
+    matches = []
+    size = len(password)
+    start = 0
+    while start < size - 1:
+        end = start + 1
+        while end < size and step_of(password, start, end):
+            end += 1
+        if end - start >= MIN_MATCH_LENGTH:
+            matches.append((start, end, bits_of(password[start:end]), kind))
+        start = max(end - 1, start + 1)
+    return matches
+
+
+def _same_char(password, start, index):
+    return password[index] == password[index - 1]
+
+
+def _repeat_bits(token):
+    return _POOL_BITS[class_mask(token[0])] + math.log2(len(token))
+
+
+def _same_class(first, second):
+    return (
+        (first.isdigit() and second.isdigit())
+        or (first.islower() and second.islower())
+        or (first.isupper() and second.isupper())
+    )
+
+
+def _sequence_step(password, start, index):
+    current, previous = password[index], password[index - 1]
+    if not _same_class(current, previous):
+        return False
+    delta = ord(current) - ord(previous)
+    if delta not in (1, -1):
+        return False
+    # The direction must stay the same for the whole run
+    if index - 2 >= start:
+        return delta == ord(previous) - ord(password[index - 2])
+    return True
+
+
+def _sequence_bits(token):
+    start = 1.0 if token[0] in "aAzZ0119" else _POOL_BITS[class_mask(token[0])]
+    descending = 1.0 if ord(token[1]) < ord(token[0]) else 0.0
+    return start + math.log2(len(token)) + descending
+
+
+def _keyboard_matches(password):
+    keys = password.translate(UNSHIFT)
+    matches = []
+    size = len(keys)
+    start = 0
+
+    while start < size - 1:
+        end = start + 1
+        while end < size and keys[end] in KEYBOARD_ADJACENCY.get(keys[end - 1], ""):
+            end += 1
+        if end - start >= MIN_MATCH_LENGTH:
+            turns = 1
+            direction = None
+            for index in range(start + 1, end):
+                row, col = KEYBOARD_POSITIONS[keys[index]]
+                prev_row, prev_col = KEYBOARD_POSITIONS[keys[index - 1]]
+                step = (row - prev_row, col - prev_col)
+                if direction is not None and step != direction:
+                    turns += 1
+                direction = step
+            shifted = 1.0 if keys[start:end] != password[start:end].lower() else 0.0
+            bits = (
+                KEYBOARD_START_BITS
+                + math.log2(end - start)
+                + turns * KEYBOARD_TURN_BITS
+                + shifted
+            )
+            matches.append((start, end, bits, "keyboard"))
+        start = max(end - 1, start + 1)
+    return matches
+
+
+def _is_date(digits):
+    # Accept ddmmyy(yy), mmddyy(yy) and yy(yy)mmdd orderings
+    if len(digits) in (6, 8):
+        year_length = len(digits) - 4
+        for day_month, year in ((digits[:4], digits[4:]), (digits[year_length:], digits[:year_length])):
+            first, second = int(day_month[:2]), int(day_month[2:])
+            if year_length == 4 and int(year) not in YEARS:
+                continue
+            if (1 <= first <= 31 and 1 <= second <= 12) or (1 <= first <= 12 and 1 <= second <= 31):
+                return True
+    return False
+
+
+def _date_matches(password):
+    matches = []
+    for found in _SEPARATED_DATE.finditer(password):
+        matches.append((found.start(), found.end(), DATE_BITS + 2, "date"))
+
+    for found in _DIGIT_RUN.finditer(password):
+        digits = found.group()
+        for start in range(len(digits)):
+            for end in range(start + 4, len(digits) + 1):
+                token = digits[start:end]
+                if len(token) == 4 and int(token) in YEARS:
+                    bits = YEAR_BITS
+                elif _is_date(token):
+                    bits = DATE_BITS
+                else:
+                    continue
+                offset = found.start()
+                matches.append((offset + start, offset + end, bits, "date"))
+    return matches
+
+
+def _block_repeat_matches(password):
+    matches = []
+    size = len(password)
+    for start in range(size):
+        for block in range(2, (size - start) // 2 + 1):
+            unit = password[start:start + block]
+            repeats = 1
+            while password.startswith(unit, start + repeats * block):
+                repeats += 1
+            if repeats >= 2:
+                bits = estimate(unit)[0] + math.log2(repeats)
+                matches.append((start, start + repeats * block, bits, "repeat"))
+    return matches
+
+
+def find_patterns(password):
+    lower = password.lower()
+    return (
+        _dictionary_matches(password, lower)
+        + _run_matches(password, _same_char, _repeat_bits, "repeat")
+        + _run_matches(password, _sequence_step, _sequence_bits, "sequence")
+        + _keyboard_matches(password)
+        + _date_matches(password)
+        + _block_repeat_matches(password)
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def estimate(password):
+    size = len(password)
+    if not size:
+        return 0, ()
+
+    char_bits = _POOL_BITS[class_mask(password)]
+    by_end = {}
+    for match in find_patterns(password):
+        by_end.setdefault(match[1], []).append(match)
+
+    # Cheapest way to spell the password out of patterns and single
+    # brute-forced characters (the approach used by zxcvbn).
+    best = [0.0] * (size + 1)
+    choice = [None] * (size + 1)
+    for end in range(1, size + 1):
+        best[end] = best[end - 1] + char_bits
+        for start, _, bits, kind in by_end.get(end, ()):
+            if best[start] + bits < best[end]:
+                best[end] = best[start] + bits
+                choice[end] = (start, kind)
+
+    patterns = []
+    end = size
+    while end > 0:
+        if choice[end] is None:
+            end -= 1
+            continue
+        start, kind = choice[end]
+        patterns.append((kind, password[start:end]))
+        end = start
+    patterns.reverse()
+
+    # Never report more than the plain character-pool estimate
+    entropy = min(round(best[size], 1), calculate_entropy(password))
+    return entropy, tuple(patterns)
+
+
+def pattern_entropy(password):
+    return estimate(password)[0]
+
+
+def score_patterns(passwords):
+    results = []
+    for password in passwords:
+        entropy = estimate(password)[0]
+        results.append((entropy, strength_from_entropy(entropy)[0]))
+    return results
+
+
+def cache_info():
+    return estimate.cache_info()
@@ -1,14 +1,50 @@
+import argparse
+import math
 import tkinter as tk
 from tkinter import messagebox, ttk
 import sqlite3
 from datetime import datetime
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import matplotlib.dates as mdates
 
+from bmi_calc import MAX_HEIGHT, bmi_category, bmi_value
+from bmi_chart import chart_data, load_view
+from bmi_db import (
+    DATE_FORMAT,
+    DB_PATH,
+    HISTORY_PAGE_SIZE,
+    SEARCH_PAGE_SIZE,
+    ConnectionPool,
+    clear_records,
+    delete_records,
+    history_page,
+    record_count,
+    schema_version,
+    search_names,
+)
+from bmi_worker import POLL_MS, DatabaseWorker
+from bmi_writer import RecordWriter
+
+# One bucket per pixel column of the 10-inch, 100 dpi chart keeps drawing
+# time bounded however many records a user has
+CHART_BUCKETS = 1000
+
+# The history search waits for this long a pause in typing before querying
+SEARCH_DELAY_MS = 250
+
+# Result colour and advice shown for each category
+CATEGORY_STYLES = {
+    "Underweight": ("#5a9fd4", "Consider a nutritious diet to gain healthy weight."),
+    "Normal": ("#6b5b95", "Amazing! Keep up your healthy habits."),
+    "Overweight": ("#d96098", "Try balanced meals and regular activity."),
+    "Obese": ("#c44569", "Please talk to a healthcare provider."),
+}
+
 class HealthTracker:
-    def __init__(self, window):
+    def __init__(self, window, db_path=DB_PATH):
         self.window = window
+        self.db_path = db_path
         self.window.title("Health & Wellness Tracker")
         self.window.geometry("520x620")
         self.window.configure(bg="#ffc8dd")
@@ -18,25 +54,56 @@ class HealthTracker:
         self.window.protocol("WM_DELETE_WINDOW", self.exit_app)
     
     def init_db(self):
-        try:
-            self.db = sqlite3.connect("bmi_data.db")
-            self.cur = self.db.cursor()
-            
-            self.cur.execute("""
-            CREATE TABLE IF NOT EXISTS bmi_records (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                weight REAL NOT NULL,
-                height REAL NOT NULL,
-                bmi REAL NOT NULL,
-                category TEXT NOT NULL,
-                date TEXT NOT NULL
-            )
-            """)
-            self.db.commit()
-        except sqlite3.Error as err:
-            messagebox.showerror("Database Error", f"Cannot initialize database: {err}")
-            self.window.destroy()
+        # Every query and save goes through one pool: a single writer
+        # connection shared by the background writer and the worker's write
+        # jobs, and separate reader connections for everything else. The
+        # pool opens the database (and applies any pending schema
+        # migrations) on the worker thread, so the window keeps redrawing.
+        self.pool = ConnectionPool(self.db_path)
+        self.worker = DatabaseWorker(self.pool, on_error=self.show_db_error)
+        # Saves are committed in the background so the window never
+        # waits on the disk
+        self.writer = RecordWriter(self.pool)
+        self.worker.submit(schema_version, on_error=self.db_unavailable)
+        self.window.after(POLL_MS, self.pump_worker)
+        self.window.after(POLL_MS, self.check_writer)
+    
+    def db_unavailable(self, err):
+        messagebox.showerror("Database Error", f"Cannot initialize database: {err}")
+        self.exit_app()
+    
+    def show_db_error(self, err):
+        messagebox.showerror("Database Error", f"Database request failed: {err}")
+    
+    def pump_worker(self):
+        self.worker.dispatch()
+        self.window.after(POLL_MS, self.pump_worker)
+    
+    def watch_window(self, window):
+        # Closing a window cancels whatever it is still waiting for
+        def closed(event):
+            if event.widget is window:
+                self.worker.cancel_owner(window)
+        window.bind("<Destroy>", closed, add="+")
+    
+    def check_writer(self):
+        # Saves are only confirmed once the writer has committed them
+        saved = []
+        while not self.writer.saved.empty():
+            saved.extend(self.writer.saved.get_nowait())
+        if len(saved) == 1:
+            _, _, _, result, status, _ = saved[0]
+            messagebox.showinfo("Success", f"BMI saved successfully!\n\nBMI: {result}\nStatus: {status}")
+        elif saved:
+            messagebox.showinfo("Success", f"{len(saved)} records saved successfully!")
+        
+        failed, reason = 0, None
+        while not self.writer.failures.empty():
+            rows, reason = self.writer.failures.get_nowait()
+            failed += len(rows)
+        if reason is not None:
+            messagebox.showerror("Database Error", f"Cannot save {failed} record(s): {reason}")
+        self.window.after(POLL_MS, self.check_writer)
     
     def build_ui(self):
         top_frame = tk.Frame(self.window, bg="#cdb4db", height=90)
@@ -200,6 +267,17 @@ class HealthTracker:
             user_weight = float(weight_input)
             user_height = float(height_input)
             
+            # float() accepts "nan" and "inf"
+            if not math.isfinite(user_weight):
+                messagebox.showerror("Invalid", "Weight must be a number")
+                self.weight_field.focus()
+                return
+            
+            if not math.isfinite(user_height):
+                messagebox.showerror("Invalid", "Height must be a number")
+                self.height_field.focus()
+                return
+            
             if user_weight <= 0:
                 messagebox.showerror("Invalid", "Weight must be positive")
                 self.weight_field.focus()
@@ -210,30 +288,14 @@ class HealthTracker:
                 self.height_field.focus()
                 return
             
-            if user_height > 3:
+            if user_height > MAX_HEIGHT:
                 messagebox.showwarning("Check Input", "Height seems high. Use meters (e.g., 1.65)")
                 self.height_field.focus()
                 return
             
-            result = user_weight / (user_height ** 2)
-            result = round(result, 2)
-            
-            if result < 18.5:
-                status = "Underweight"
-                shade = "#5a9fd4"
-                tip = "Consider a nutritious diet to gain healthy weight."
-            elif result < 25:
-                status = "Normal"
-                shade = "#6b5b95"
-                tip = "Amazing! Keep up your healthy habits."
-            elif result < 30:
-                status = "Overweight"
-                shade = "#d96098"
-                tip = "Try balanced meals and regular activity."
-            else:
-                status = "Obese"
-                shade = "#c44569"
-                tip = "Please talk to a healthcare provider."
+            result = bmi_value(user_weight, user_height)
+            status = bmi_category(result)
+            shade, tip = CATEGORY_STYLES[status]
             
             self.output_label.config(
                 text=f"BMI: {result}\nStatus: {status}\n\n{tip}",
@@ -241,13 +303,10 @@ class HealthTracker:
                 font=("Georgia", 12, "bold")
             )
             
-            self.cur.execute(
-                "INSERT INTO bmi_records VALUES (NULL, ?, ?, ?, ?, ?, ?)",
-                (user_name, user_weight, user_height, result, status, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            # check_writer confirms the save once it is committed
+            self.writer.submit(
+                (user_name, user_weight, user_height, result, status, datetime.now().strftime(DATE_FORMAT))
             )
-            self.db.commit()
-            
-            messagebox.showinfo("Success", f"BMI saved successfully!\n\nBMI: {result}\nStatus: {status}")
             
         except ValueError:
             messagebox.showerror("Invalid", "Please enter valid numbers")
@@ -257,28 +316,69 @@ class HealthTracker:
             messagebox.showerror("Error", f"Something went wrong: {err}")
     
     def display_history(self):
+        self.worker.submit(
+            history_page,
+            on_done=self.show_history,
+            on_error=lambda err: messagebox.showerror("Database Error", f"Cannot load history: {err}")
+        )
+    
+    def show_history(self, data):
         try:
-            self.cur.execute(
-                "SELECT id, name, bmi, category, date FROM bmi_records ORDER BY date DESC"
-            )
-            data = self.cur.fetchall()
-            
             if not data:
                 messagebox.showinfo("No Data", "No history available")
                 return
             
             hist_win = tk.Toplevel(self.window)
             hist_win.title("History - All Users")
-            hist_win.geometry("720x420")
+            hist_win.geometry("720x560")
             hist_win.configure(bg="#ffc8dd")
+            self.watch_window(hist_win)
             
-            tk.Label(
+            heading = tk.Label(
                 hist_win,
                 text="BMI History for Everyone",
                 font=("Georgia", 15, "bold"),
                 bg="#ffc8dd",
                 fg="#4a4a4a"
-            ).pack(pady=12)
+            )
+            heading.pack(pady=12)
+            
+            search_frame = tk.Frame(hist_win, bg="#ffc8dd")
+            search_frame.pack(fill=tk.X, padx=12)
+            
+            tk.Label(
+                search_frame,
+                text="Search",
+                font=("Georgia", 11),
+                bg="#ffc8dd",
+                fg="#4a4a4a"
+            ).pack(side=tk.LEFT)
+            
+            search_text = tk.StringVar()
+            search_field = tk.Entry(
+                search_frame,
+                textvariable=search_text,
+                font=("Georgia", 11),
+                relief=tk.FLAT,
+                bd=0
+            )
+            search_field.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=8, ipady=4)
+            
+            # Matching names, filled as the user types; picking one narrows
+            # the table to that user
+            match_frame = tk.Frame(hist_win, bg="#ffc8dd")
+            match_scroll = ttk.Scrollbar(match_frame)
+            match_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+            match_list = tk.Listbox(
+                match_frame,
+                height=5,
+                font=("Georgia", 10),
+                relief=tk.FLAT,
+                bd=0,
+                activestyle="none"
+            )
+            match_list.pack(fill=tk.X, expand=True)
+            match_scroll.config(command=match_list.yview)
             
             list_frame = tk.Frame(hist_win, bg="#ffc8dd")
             list_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
@@ -289,8 +389,7 @@ class HealthTracker:
             table = ttk.Treeview(
                 list_frame,
                 columns=("Name", "Date", "BMI", "Category"),
-                show="headings",
-                yscrollcommand=scroll.set
+                show="headings"
             )
             table.pack(fill=tk.BOTH, expand=True)
             
@@ -306,8 +405,117 @@ class HealthTracker:
             table.column("BMI", width=110)
             table.column("Category", width=160)
             
-            for item in data:
-                table.insert("", tk.END, values=(item[1], item[4], item[2], item[3]))
+            # Only one page is loaded up front; the next one is fetched when
+            # the user scrolls near the bottom of what is already shown.
+            # `name` is the user the table is narrowed to, None for everyone.
+            paging = {"name": None, "last": None, "done": False, "request": None}
+            
+            def add_rows(rows):
+                paging["request"] = None
+                for item in rows:
+                    # The row id doubles as the item id so deletes go by primary key
+                    table.insert("", tk.END, iid=str(item[0]), values=(item[1], item[4], item[2], item[3]))
+                if rows:
+                    paging["last"] = (rows[-1][5], rows[-1][0])
+                if len(rows) < HISTORY_PAGE_SIZE:
+                    paging["done"] = True
+            
+            def page_failed(err):
+                paging["request"] = None
+                paging["done"] = True
+                messagebox.showerror("Database Error", f"Cannot load history: {err}")
+            
+            def load_page():
+                paging["request"] = self.worker.submit(
+                    history_page, paging["last"], HISTORY_PAGE_SIZE, paging["name"],
+                    on_done=add_rows, on_error=page_failed, owner=hist_win
+                )
+            
+            def on_scroll(first, last):
+                scroll.set(first, last)
+                if not paging["done"] and paging["request"] is None and float(last) > 0.9:
+                    load_page()
+            
+            def show_user(name):
+                if paging["request"] is not None:
+                    self.worker.cancel(paging["request"])
+                table.delete(*table.get_children())
+                paging.update(name=name, last=None, done=False)
+                heading.config(text=f"BMI History for {name}" if name else "BMI History for Everyone")
+                load_page()
+            
+            table.config(yscrollcommand=on_scroll)
+            add_rows(data)
+            
+            # Searches run on the worker like everything else; a new
+            # keystroke cancels both the pending timer and any query still
+            # running, so only the latest text ever fills the list
+            search = {"text": "", "names": [], "timer": None, "request": None, "done": True}
+            
+            def add_matches(rows):
+                search["request"] = None
+                for name, records in rows:
+                    search["names"].append(name)
+                    match_list.insert(tk.END, f"{name}  ({records})")
+                if len(rows) < SEARCH_PAGE_SIZE:
+                    search["done"] = True
+                if not search["names"]:
+                    match_list.insert(tk.END, "No matching users")
+            
+            def search_failed(err):
+                search["request"] = None
+                search["done"] = True
+                messagebox.showerror("Database Error", f"Cannot search: {err}")
+            
+            def load_matches():
+                search["request"] = self.worker.submit(
+                    search_names, search["text"], SEARCH_PAGE_SIZE, len(search["names"]),
+                    on_done=add_matches, on_error=search_failed, owner=hist_win
+                )
+            
+            def run_search():
+                search["timer"] = None
+                text = search_text.get().strip()
+                if text == search["text"]:
+                    return
+                if search["request"] is not None:
+                    self.worker.cancel(search["request"])
+                    search["request"] = None
+                search.update(text=text, names=[], done=not text)
+                match_list.delete(0, tk.END)
+                
+                if text:
+                    match_frame.pack(fill=tk.X, padx=12, pady=(8, 0), before=list_frame)
+                    load_matches()
+                else:
+                    match_frame.pack_forget()
+                    if paging["name"] is not None:
+                        show_user(None)
+            
+            def on_type(*_):
+                if search["timer"] is not None:
+                    hist_win.after_cancel(search["timer"])
+                search["timer"] = hist_win.after(SEARCH_DELAY_MS, run_search)
+            
+            def on_match_scroll(first, last):
+                match_scroll.set(first, last)
+                if not search["done"] and search["request"] is None and float(last) > 0.9:
+                    load_matches()
+            
+            def on_pick(_):
+                chosen = match_list.curselection()
+                if chosen and chosen[0] < len(search["names"]):
+                    show_user(search["names"][chosen[0]])
+            
+            def on_close(event):
+                if event.widget is hist_win and search["timer"] is not None:
+                    hist_win.after_cancel(search["timer"])
+            
+            search_text.trace_add("write", on_type)
+            hist_win.bind("<Destroy>", on_close, add="+")
+            match_list.config(yscrollcommand=on_match_scroll)
+            match_list.bind("<<ListboxSelect>>", on_pick)
+            search_field.focus()
             
             def remove_item():
                 chosen = table.selection()
@@ -316,15 +524,19 @@ class HealthTracker:
                     return
                 
                 if messagebox.askyesno("Confirm", "Delete selected record(s)?"):
-                    for selected in chosen:
-                        vals = table.item(selected)['values']
-                        self.cur.execute(
-                            "DELETE FROM bmi_records WHERE name=? AND date=? AND bmi=?",
-                            (vals[0], vals[1], vals[2])
-                        )
-                        table.delete(selected)
-                    self.db.commit()
-                    messagebox.showinfo("Done", "Record(s) deleted")
+                    def deleted(_):
+                        if table.winfo_exists():
+                            table.delete(*[item for item in chosen if table.exists(item)])
+                        messagebox.showinfo("Done", "Record(s) deleted")
+                    
+                    # Not tied to the window: a confirmed delete still happens
+                    # if the history is closed straight away
+                    self.worker.submit(
+                        delete_records, chosen,
+                        write=True,
+                        on_done=deleted,
+                        on_error=lambda err: messagebox.showerror("Database Error", f"Cannot delete: {err}")
+                    )
             
             del_btn = tk.Button(
                 hist_win,
@@ -340,8 +552,6 @@ class HealthTracker:
             del_btn.pack(pady=12)
             self.make_rounded(del_btn)
             
-        except sqlite3.Error as err:
-            messagebox.showerror("Database Error", f"Cannot load history: {err}")
         except Exception as err:
             messagebox.showerror("Error", f"Something went wrong: {err}")
     
@@ -353,30 +563,68 @@ class HealthTracker:
             self.name_field.focus()
             return
         
+        self.worker.submit(
+            chart_data, user_name, CHART_BUCKETS,
+            on_done=lambda data: self.show_chart(user_name, *data),
+            on_error=lambda err: messagebox.showerror("Database Error", f"Cannot load data: {err}")
+        )
+    
+    def show_chart(self, user_name, summary, view):
         try:
-            self.cur.execute(
-                "SELECT bmi, date FROM bmi_records WHERE name=? ORDER BY date",
-                (user_name,)
-            )
-            data = self.cur.fetchall()
-            
-            if not data:
+            if not summary:
                 messagebox.showinfo("No Data", f"No records for {user_name}")
                 return
             
-            if len(data) < 2:
+            if summary["count"] < 2:
                 messagebox.showinfo("Need More Data", f"{user_name} needs at least 2 records")
                 return
             
-            values = [item[0] for item in data]
-            timestamps = [datetime.strptime(item[1], "%Y-%m-%d %H:%M:%S") for item in data]
-            
             chart_win = tk.Toplevel(self.window)
             chart_win.title(f"BMI Chart - {user_name}")
-            chart_win.geometry("820x620")
+            chart_win.geometry("820x660")
+            self.watch_window(chart_win)
+            
+            tk.Label(
+                chart_win,
+                text=(
+                    f"{summary['count']} records  •  Average BMI {summary['mean']}  •  "
+                    f"Range {summary['min']}–{summary['max']}  •  Latest: {summary['latest_category']}"
+                ),
+                font=("Georgia", 11),
+                fg="#4a4a4a"
+            ).pack(pady=6)
             
             figure, axis = plt.subplots(figsize=(10, 6))
-            axis.plot(timestamps, values, marker='o', linestyle='-', linewidth=2, markersize=8, color="#cdb4db")
+            # taken_at is local wall-clock seconds since 1970, so it maps onto
+            # Matplotlib date numbers without parsing any text
+            epoch = mdates.date2num(datetime(1970, 1, 1))
+            
+            def marker_for(points):
+                # Markers only help while single measurements can be told apart
+                return 'o' if len(points) <= 200 else ''
+            
+            def draw_view(view):
+                # Long ranges come from the daily/weekly/monthly rollups, drawn
+                # as the mean with a min-max band; short ones from raw records
+                seconds, shown, low, high = view
+                if not len(seconds):
+                    return
+                points = epoch + seconds / 86400
+                if line:
+                    line[0].set_data(points, shown)
+                    line[0].set_marker(marker_for(points))
+                else:
+                    line.extend(axis.plot(
+                        points, shown, marker=marker_for(points), linestyle='-',
+                        linewidth=2, markersize=8, color="#cdb4db"
+                    ))
+                if band:
+                    band.pop().remove()
+                if low is not None:
+                    band.append(axis.fill_between(points, low, high, color="#cdb4db", alpha=0.3, linewidth=0))
+            
+            line, band = [], []
+            draw_view(view)
             
             axis.axhline(y=18.5, color='#a2d2ff', linestyle='--', alpha=0.7, label='Underweight')
             axis.axhline(y=25, color='#cdb4db', linestyle='--', alpha=0.7, label='Normal')
@@ -388,49 +636,90 @@ class HealthTracker:
             axis.grid(True, alpha=0.3)
             axis.legend()
             
+            axis.xaxis_date()
             axis.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
             figure.autofmt_xdate()
             
             display = FigureCanvasTkAgg(figure, master=chart_win)
+            NavigationToolbar2Tk(display, chart_win).update()
             display.draw()
             display.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            chart_win.bind("<Destroy>", lambda event: event.widget is chart_win and plt.close(figure), add="+")
+            
+            reloading = []
+            
+            def redraw(view):
+                draw_view(view)
+                display.draw_idle()
+            
+            def reload_view(axis):
+                # Zooming or panning re-reads just the visible range (plus one
+                # view width either side), so a narrow enough window shows
+                # every single measurement. A newer view supersedes one that
+                # is still loading.
+                low, high = axis.get_xlim()
+                width = high - low
+                if reloading:
+                    self.worker.cancel(reloading.pop())
+                reloading.append(self.worker.submit(
+                    load_view, user_name, 3 * CHART_BUCKETS,
+                    (low - width - epoch) * 86400, (high + width - epoch) * 86400,
+                    on_done=redraw, owner=chart_win
+                ))
+            
+            axis.callbacks.connect('xlim_changed', reload_view)
             
-        except sqlite3.Error as err:
-            messagebox.showerror("Database Error", f"Cannot load data: {err}")
         except Exception as err:
             messagebox.showerror("Error", f"Something went wrong: {err}")
     
     def erase_all(self):
-        try:
-            self.cur.execute("SELECT COUNT(*) FROM bmi_records")
-            total = self.cur.fetchone()[0]
-            
-            if total == 0:
-                messagebox.showinfo("No Data", "Database is empty")
-                return
-            
-            if messagebox.askyesno(
-                "Confirm Deletion",
-                f"Delete ALL {total} record(s)?\nThis cannot be undone!"
-            ):
-                self.cur.execute("DELETE FROM bmi_records")
-                self.db.commit()
-                messagebox.showinfo("Done", "All records deleted")
-                self.output_label.config(text="Fill in your details and click Calculate", fg="#4a4a4a")
+        self.worker.submit(
+            record_count,
+            on_done=self.confirm_erase,
+            on_error=lambda err: messagebox.showerror("Database Error", f"Cannot clear: {err}")
+        )
+    
+    def confirm_erase(self, total):
+        if total == 0:
+            messagebox.showinfo("No Data", "Database is empty")
+            return
         
-        except sqlite3.Error as err:
-            messagebox.showerror("Database Error", f"Cannot clear: {err}")
-        except Exception as err:
-            messagebox.showerror("Error", f"Something went wrong: {err}")
+        if messagebox.askyesno(
+            "Confirm Deletion",
+            f"Delete ALL {total} record(s)?\nThis cannot be undone!"
+        ):
+            # Saves queued before the confirmation must land before the
+            # table is emptied. The request waits for the writer to commit
+            # them before it takes the write connection the writer needs.
+            self.worker.submit(
+                clear_records,
+                write=True,
+                wait_for=self.writer.mark(),
+                on_done=self.erased,
+                on_error=lambda err: messagebox.showerror("Database Error", f"Cannot clear: {err}")
+            )
+    
+    def erased(self, _):
+        messagebox.showinfo("Done", "All records deleted")
+        self.output_label.config(text="Fill in your details and click Calculate", fg="#4a4a4a")
     
     def exit_app(self):
         try:
-            self.db.close()
+            # Drops pending reads but finishes confirmed deletes and clears;
+            # the writer is still running, so a clear waiting on it proceeds
+            self.worker.close()
+            # Commits anything still queued before the process exits
+            self.writer.close()
+            self.pool.close()
         except:
             pass
         self.window.destroy()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Health & Wellness Tracker")
+    parser.add_argument("--db", default=DB_PATH, help=f"database file, may be shared by several trackers (default: {DB_PATH})")
+    args = parser.parse_args()
+    
     root = tk.Tk()
-    app = HealthTracker(root)
+    app = HealthTracker(root, args.db)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,37 @@
+import math
+from bisect import bisect_right
+
+# Upper bounds of the first three categories; anything above the last is Obese
+CATEGORY_THRESHOLDS = (18.5, 25, 30)
+CATEGORIES = ("Underweight", "Normal", "Overweight", "Obese")
+
+# Heights are entered in meters; anything taller is almost certainly centimeters
+MAX_HEIGHT = 3
+
+
+def check_measurements(weight, height):
+    # nan slips past the comparisons below and inf would be stored as is
+    if not math.isfinite(weight):
+        raise ValueError("Weight must be a number")
+    if not math.isfinite(height):
+        raise ValueError("Height must be a number")
+    if weight <= 0:
+        raise ValueError("Weight must be positive")
+    if height <= 0:
+        raise ValueError("Height must be positive")
+    if height > MAX_HEIGHT:
+        raise ValueError("Height seems high. Use meters (e.g., 1.65)")
+
+
+def bmi_value(weight, height):
+    return round(weight / (height ** 2), 2)
+
+
+def bmi_category(bmi):
+    return CATEGORIES[bisect_right(CATEGORY_THRESHOLDS, bmi)]
+
+
+def measure(weight, height):
+    check_measurements(weight, height)
+    bmi = bmi_value(weight, height)
+    return bmi, bmi_category(bmi)
@@ -0,0 +1,145 @@
+import numpy as np
+
+# Roughly the plot width in pixels; each bucket keeps at most four points
+DEFAULT_BUCKETS = 1000
+
+# Views holding more raw measurements than this are drawn from the rollup
+# tables instead of bmi_records
+RAW_LIMIT = 50_000
+
+ROLLUP_DTYPE = np.dtype([
+    ("bucket", "i8"), ("count", "i8"), ("mean", "f8"), ("low", "f8"), ("high", "f8"),
+])
+
+SERIES_DTYPE = np.dtype([("taken_at", "i8"), ("bmi", "f8")])
+
+
+def load_series(db, name, start=None, end=None):
+    # Streams straight from the cursor into a structured array, without an
+    # intermediate list of row tuples; start/end are taken_at bounds and use
+    # the (name, taken_at) index
+    query = "SELECT taken_at, bmi FROM bmi_records WHERE name=?"
+    params = [name]
+    if start is not None:
+        query += " AND taken_at >= ?"
+        params.append(int(start))
+    if end is not None:
+        query += " AND taken_at <= ?"
+        params.append(int(end))
+    rows = db.execute(query + " ORDER BY taken_at", params)
+    series = np.fromiter(rows, dtype=SERIES_DTYPE)
+    return series["taken_at"], series["bmi"]
+
+
+def downsample(x, y, buckets=DEFAULT_BUCKETS):
+    # Min/max bucketing: x is split into equal-width buckets (one per pixel
+    # column) and each keeps its first, last, lowest and highest point. The
+    # drawn line then covers the same vertical extent in every column as the
+    # full series, so spikes and the overall trend survive.
+    size = len(x)
+    if size <= 4 * buckets:
+        return np.arange(size)
+
+    span = x[-1] - x[0]
+    bucket = ((x - x[0]) * (buckets / span)).astype(np.int64) if span else np.zeros(size, np.int64)
+    np.minimum(bucket, buckets - 1, out=bucket)
+
+    # x is sorted, so the buckets are contiguous runs; `run` maps every
+    # point to the run it belongs to
+    starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+    ends = np.append(starts[1:], size) - 1
+    run = np.repeat(np.arange(len(starts)), ends - starts + 1)
+
+    def first_per_run(mask):
+        hits = np.flatnonzero(mask)
+        return hits[np.flatnonzero(np.diff(run[hits], prepend=-1))]
+
+    lowest = first_per_run(y == np.minimum.reduceat(y, starts)[run])
+    highest = first_per_run(y == np.maximum.reduceat(y, starts)[run])
+
+    return np.unique(np.concatenate((starts, ends, lowest, highest)))
+
+
+def _bucket_range(start, end):
+    clauses, params = "", []
+    if start is not None:
+        clauses += " AND bucket >= ?"
+        params.append(int(start))
+    if end is not None:
+        clauses += " AND bucket <= ?"
+        params.append(int(end))
+    return clauses, params
+
+
+def rollup_series(db, name, period, start=None, end=None):
+    clauses, params = _bucket_range(start, end)
+    rows = db.execute(
+        "SELECT bucket, count, bmi_sum / count, bmi_min, bmi_max FROM bmi_rollups "
+        f"WHERE name=? AND period=?{clauses} ORDER BY bucket",
+        [name, period, *params]
+    )
+    return np.fromiter(rows, dtype=ROLLUP_DTYPE)
+
+
+def load_view(db, name, buckets=DEFAULT_BUCKETS, start=None, end=None):
+    # Returns (taken_at, bmi, low, high) for the range; low/high are None
+    # when raw measurements are shown, and the bucket min/max otherwise
+    clauses, params = _bucket_range(None if start is None else start - 86400, end)
+    total = db.execute(
+        f"SELECT COALESCE(SUM(count), 0) FROM bmi_rollups WHERE name=? AND period='day'{clauses}",
+        [name, *params]
+    ).fetchone()[0]
+
+    if total <= RAW_LIMIT:
+        taken_at, values = load_series(db, name, start, end)
+        keep = downsample(taken_at, values, buckets)
+        return taken_at[keep], values[keep], None, None
+
+    # The finest period that still fits the width of the plot
+    for period in ("day", "week", "month"):
+        series = rollup_series(db, name, period, start, end)
+        if len(series) <= buckets:
+            break
+    return series["bucket"], series["mean"], series["low"], series["high"]
+
+
+def user_summary(db, name):
+    count, total, low, high = db.execute(
+        "SELECT SUM(count), SUM(bmi_sum), MIN(bmi_min), MAX(bmi_max) FROM bmi_rollups "
+        "WHERE name=? AND period='month'",
+        (name,)
+    ).fetchone()
+    if not count:
+        return None
+    latest = db.execute(
+        "SELECT latest_category FROM bmi_rollups WHERE name=? AND period='month' "
+        "ORDER BY bucket DESC LIMIT 1",
+        (name,)
+    ).fetchone()[0]
+    return {
+        "count": count,
+        "mean": round(total / count, 2),
+        "min": low,
+        "max": high,
+        "latest_category": latest,
+    }
+
+
+def latest_trends(db, period="month"):
+    # Each user's most recent bucket, read through the rollup primary key:
+    # a dashboard over thousands of users touches one row per user
+    return db.execute(
+        "SELECT name, bucket, count, ROUND(bmi_sum / count, 2), bmi_min, bmi_max, latest_category "
+        "FROM bmi_rollups AS r WHERE period=? AND bucket = ("
+        "    SELECT MAX(bucket) FROM bmi_rollups WHERE name=r.name AND period=r.period"
+        ") ORDER BY name",
+        (period,)
+    ).fetchall()
+
+
+def chart_data(db, name, buckets=DEFAULT_BUCKETS):
+    # Everything the chart window needs to open, in one worker round trip
+    summary = user_summary(db, name)
+    if not summary or summary["count"] < 2:
+        return summary, None
+    return summary, load_view(db, name, buckets)
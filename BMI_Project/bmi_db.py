@@ -0,0 +1,700 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Several tracker processes can share one file: point them all at it with
+# BMI_DB_PATH (or the --db option)
+DB_PATH = os.environ.get("BMI_DB_PATH", "bmi_data.db")
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Rows fetched per page of the history view
+HISTORY_PAGE_SIZE = 200
+
+# Names fetched per page of history search results
+SEARCH_PAGE_SIZE = 50
+
+# Near matches re-ranked by edit distance per search, and the most edits
+# told apart when ranking them
+FUZZY_CANDIDATES = 200
+FUZZY_MAX_EDITS = 2
+
+# Seconds a connection waits for another connection or process to release
+# its lock before failing with "database is locked"
+BUSY_TIMEOUT = 10.0
+
+# Reader connections kept open per process by ConnectionPool
+POOL_READERS = 2
+
+# Rows converted per transaction by the taken_at backfill
+BACKFILL_BATCH = 50_000
+
+# taken_at holds the measurement time as seconds since 1970-01-01 in local
+# wall-clock time, i.e. the `date` text read as if it were UTC. It sorts and
+# compares as a plain integer, and date2num-style day numbers for charts
+# are just taken_at / 86400.
+EPOCH_OF = "CAST(strftime('%s', {}) AS INTEGER)"
+
+
+def _backfill_taken_at(db, batch=BACKFILL_BATCH):
+    # Walks the table in id ranges, one short transaction each, so the
+    # tracker and other processes can keep using the database meanwhile.
+    # Safe to repeat, so an interrupted upgrade simply runs again.
+    last = db.execute("SELECT MAX(id) FROM bmi_records").fetchone()[0] or 0
+    for start in range(0, last, batch):
+        with db:
+            db.execute(
+                f"UPDATE bmi_records SET taken_at = {EPOCH_OF.format('date')} "
+                "WHERE id > ? AND id <= ? AND taken_at IS NULL",
+                (start, start + batch)
+            )
+
+
+# Rollup periods: SQL for the start of the bucket holding taken_at `{t}`,
+# and for the start of the next bucket after bucket `{b}`. Weeks start on
+# Monday (1970-01-01 was a Thursday).
+ROLLUP_PERIODS = {
+    "day": ("{t} - {t} % 86400", "{b} + 86400"),
+    "week": ("({t} - {t} % 86400) - (({t} / 86400 + 3) % 7) * 86400", "{b} + 604800"),
+    "month": (
+        "CAST(strftime('%s', {t}, 'unixepoch', 'start of month') AS INTEGER)",
+        "CAST(strftime('%s', {b}, 'unixepoch', '+1 month') AS INTEGER)",
+    ),
+}
+
+
+_ROLLUP_COLUMNS = (
+    "name, period, bucket, count, bmi_sum, bmi_min, bmi_max, latest_taken_at, latest_category"
+)
+
+_ROLLUP_MERGE = """
+    ON CONFLICT (name, period, bucket) DO UPDATE SET
+        count = count + excluded.count,
+        bmi_sum = bmi_sum + excluded.bmi_sum,
+        bmi_min = MIN(bmi_min, excluded.bmi_min),
+        bmi_max = MAX(bmi_max, excluded.bmi_max),
+        latest_category = CASE WHEN excluded.latest_taken_at >= latest_taken_at
+                               THEN excluded.latest_category ELSE latest_category END,
+        latest_taken_at = MAX(latest_taken_at, excluded.latest_taken_at)
+"""
+
+
+def _rollup_add(row):
+    # One upsert per period folds a new measurement into its buckets
+    statements = []
+    for period, (start, _) in ROLLUP_PERIODS.items():
+        statements.append(f"""
+            INSERT INTO bmi_rollups ({_ROLLUP_COLUMNS})
+            VALUES ({row}.name, '{period}', {start.format(t=f"{row}.taken_at")}, 1, {row}.bmi,
+                    {row}.bmi, {row}.bmi, {row}.taken_at, {row}.category)
+            {_ROLLUP_MERGE};
+        """)
+    return "".join(statements)
+
+
+def _rollup_merge_rows(where):
+    # Same effect as running _rollup_add for every bmi_records row matching
+    # `where`, but as one grouped upsert per period
+    statements = []
+    for period, (start, _) in ROLLUP_PERIODS.items():
+        statements.append(f"""
+            INSERT INTO bmi_rollups ({_ROLLUP_COLUMNS})
+            SELECT name, '{period}', bucket, count, bmi_sum, bmi_min, bmi_max, latest_taken_at,
+                   (SELECT category FROM bmi_records AS latest
+                    WHERE latest.name = grouped.name AND latest.taken_at = grouped.latest_taken_at
+                    ORDER BY latest.id DESC LIMIT 1)
+            FROM (
+                SELECT name, {start.format(t="taken_at")} AS bucket, COUNT(*) AS count,
+                       SUM(bmi) AS bmi_sum, MIN(bmi) AS bmi_min, MAX(bmi) AS bmi_max,
+                       MAX(taken_at) AS latest_taken_at
+                -- NOT INDEXED keeps an id range a rowid range scan rather than a
+                -- walk of the whole (name, taken_at) index
+                FROM bmi_records NOT INDEXED WHERE taken_at IS NOT NULL AND {where}
+                GROUP BY name, bucket
+            ) AS grouped
+            -- WHERE keeps SQLite from reading ON CONFLICT as a join constraint
+            WHERE 1
+            {_ROLLUP_MERGE}
+        """)
+    return statements
+
+
+def _rollup_remove():
+    # Count and sum are simply decremented. Min, max and the latest category
+    # are re-read from the bucket's raw rows (an index range scan) only when
+    # the deleted row was the one providing them.
+    statements = []
+    for period, (start, end) in ROLLUP_PERIODS.items():
+        bucket = start.format(t="OLD.taken_at")
+        following = end.format(b=bucket)
+        key = f"name = OLD.name AND period = '{period}' AND bucket = {bucket}"
+        rows = f"name = OLD.name AND taken_at >= {bucket} AND taken_at < {following}"
+        statements.append(f"""
+            UPDATE bmi_rollups SET count = count - 1, bmi_sum = bmi_sum - OLD.bmi WHERE {key};
+            DELETE FROM bmi_rollups WHERE {key} AND count <= 0;
+            UPDATE bmi_rollups SET
+                bmi_min = (SELECT MIN(bmi) FROM bmi_records WHERE {rows}),
+                bmi_max = (SELECT MAX(bmi) FROM bmi_records WHERE {rows}),
+                (latest_taken_at, latest_category) = (
+                    SELECT taken_at, category FROM bmi_records WHERE {rows}
+                    ORDER BY taken_at DESC, id DESC LIMIT 1
+                )
+            WHERE {key}
+                AND (bmi_min = OLD.bmi OR bmi_max = OLD.bmi OR latest_taken_at = OLD.taken_at);
+        """)
+    return "".join(statements)
+
+
+ROLLUP_TRIGGERS = {
+    # bulk_insert folds its rows in afterwards, all at once
+    "bmi_rollups_insert": f"""
+    CREATE TRIGGER IF NOT EXISTS bmi_rollups_insert
+    AFTER INSERT ON bmi_records
+    WHEN NEW.taken_at IS NOT NULL AND NOT EXISTS (SELECT 1 FROM bmi_bulk_insert)
+    BEGIN {_rollup_add("NEW")} END
+    """,
+    "bmi_rollups_delete": f"""
+    CREATE TRIGGER IF NOT EXISTS bmi_rollups_delete
+    AFTER DELETE ON bmi_records WHEN OLD.taken_at IS NOT NULL
+    BEGIN {_rollup_remove()} END
+    """,
+}
+
+def fold_name(name):
+    # Case folding for name search, in Python so that it covers all of
+    # Unicode (SQLite's lower() only folds ASCII)
+    return name.casefold()
+
+
+def _refold_names(db):
+    # Safe to repeat, like the other backfills
+    with db:
+        db.executemany(
+            "UPDATE bmi_names SET folded = ? WHERE id = ?",
+            [(fold_name(name), name_id) for name_id, name in db.execute("SELECT id, name FROM bmi_names")]
+        )
+
+
+# bmi_names holds each distinct name once with its record count; the
+# trigram index over it serves the history search box. New names are added
+# by insert_records, which folds them in Python; SQL has no such function
+# that every connection could rely on, so only deletes use a trigger.
+NAME_TRIGGERS = {
+    "bmi_names_delete": """
+    CREATE TRIGGER IF NOT EXISTS bmi_names_delete AFTER DELETE ON bmi_records
+    BEGIN
+        UPDATE bmi_names SET records = records - 1 WHERE name = OLD.name;
+        DELETE FROM bmi_names WHERE name = OLD.name AND records <= 0;
+    END
+    """,
+}
+
+# Triggers on bmi_records, by name
+RECORD_TRIGGERS = {**ROLLUP_TRIGGERS, **NAME_TRIGGERS}
+
+
+# Each migration brings the schema to the given version. The current version
+# is kept in SQLite's user_version pragma, so existing bmi_data.db files are
+# upgraded in place the next time the tracker opens them. Plain SQL steps of
+# a version run in one transaction; callable steps are data backfills that
+# run first and commit in batches of their own.
+MIGRATIONS = [
+    (1, [
+        """
+        CREATE TABLE IF NOT EXISTS bmi_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            weight REAL NOT NULL,
+            height REAL NOT NULL,
+            bmi REAL NOT NULL,
+            category TEXT NOT NULL,
+            date TEXT NOT NULL
+        )
+        """,
+    ]),
+    (2, [
+        # Per-user charts filter on name and sort by date
+        "CREATE INDEX IF NOT EXISTS idx_bmi_records_name_date ON bmi_records (name, date)",
+        # History lists everyone's records newest first
+        "CREATE INDEX IF NOT EXISTS idx_bmi_records_date ON bmi_records (date)",
+    ]),
+    (3, [
+        # Progress of bulk imports, committed with each batch so an
+        # interrupted import can pick up where it stopped
+        """
+        CREATE TABLE IF NOT EXISTS bmi_imports (
+            source TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            rows_read INTEGER NOT NULL,
+            rows_imported INTEGER NOT NULL,
+            rows_rejected INTEGER NOT NULL,
+            finished INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+    ]),
+    # Tracker builds from before this version insert seven values without
+    # naming the columns, which fails once the table has eight; they can
+    # still read a migrated file but no longer write to it
+    (4, [
+        "ALTER TABLE bmi_records ADD COLUMN taken_at INTEGER",
+    ]),
+    (5, [
+        _backfill_taken_at,
+        "CREATE INDEX IF NOT EXISTS idx_bmi_records_name_taken_at ON bmi_records (name, taken_at)",
+        "CREATE INDEX IF NOT EXISTS idx_bmi_records_taken_at ON bmi_records (taken_at)",
+        # Superseded by the taken_at indexes above
+        "DROP INDEX IF EXISTS idx_bmi_records_name_date",
+        "DROP INDEX IF EXISTS idx_bmi_records_date",
+    ]),
+    (6, [
+        # Per-user daily, weekly and monthly summaries kept current by
+        # triggers, so charts and dashboards need not scan raw records.
+        # The mean BMI of a bucket is bmi_sum / count.
+        """
+        CREATE TABLE IF NOT EXISTS bmi_rollups (
+            name TEXT NOT NULL,
+            period TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            bmi_sum REAL NOT NULL,
+            bmi_min REAL NOT NULL,
+            bmi_max REAL NOT NULL,
+            latest_taken_at INTEGER NOT NULL,
+            latest_category TEXT,
+            PRIMARY KEY (name, period, bucket)
+        ) WITHOUT ROWID
+        """,
+        # Initial contents for databases that already hold records
+        *_rollup_merge_rows("1"),
+        # As it was before version 10
+        f"""
+        CREATE TRIGGER IF NOT EXISTS bmi_rollups_insert
+        AFTER INSERT ON bmi_records WHEN NEW.taken_at IS NOT NULL
+        BEGIN {_rollup_add("NEW")} END
+        """,
+        ROLLUP_TRIGGERS["bmi_rollups_delete"],
+    ]),
+    (7, [
+        """
+        CREATE TABLE IF NOT EXISTS bmi_names (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            folded TEXT NOT NULL,
+            records INTEGER NOT NULL
+        )
+        """,
+        # Case-insensitive prefix lookups are range scans on the folded name
+        "CREATE INDEX IF NOT EXISTS idx_bmi_names_folded ON bmi_names (folded)",
+        # Substring and typo-tolerant matching; the index stores no copy of
+        # the names, it reads them from bmi_names
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS bmi_name_search USING fts5(
+            name, content='bmi_names', content_rowid='id', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS bmi_name_search_insert AFTER INSERT ON bmi_names
+        BEGIN
+            INSERT INTO bmi_name_search (rowid, name) VALUES (NEW.id, NEW.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS bmi_name_search_delete AFTER DELETE ON bmi_names
+        BEGIN
+            INSERT INTO bmi_name_search (bmi_name_search, rowid, name) VALUES ('delete', OLD.id, OLD.name);
+        END
+        """,
+        """
+        INSERT INTO bmi_names (name, folded, records)
+        SELECT name, lower(name), COUNT(*) FROM bmi_records GROUP BY name
+        """,
+        *NAME_TRIGGERS.values(),
+    ]),
+    # SQLite's lower() only folds ASCII, so "Émile" never matched a search
+    # for "émi"; names are folded with fold_name from here on
+    (8, [
+        _refold_names,
+    ]),
+    # Files from before this version have an insert trigger on bmi_records
+    # for bmi_names; insert_records does that job now
+    (9, [
+        "DROP TRIGGER IF EXISTS bmi_names_insert",
+    ]),
+    # bulk_insert used to drop and re-create the rollup trigger for every
+    # batch, and each schema change makes every other connection prepare its
+    # statements again. It now holds a row in bmi_bulk_insert instead, which
+    # the trigger checks; the row is deleted before the batch commits, so no
+    # other connection ever sees it.
+    (10, [
+        "CREATE TABLE IF NOT EXISTS bmi_bulk_insert (id INTEGER PRIMARY KEY)",
+        "DROP TRIGGER IF EXISTS bmi_rollups_insert",
+        ROLLUP_TRIGGERS["bmi_rollups_insert"],
+    ]),
+    # Files from before this version have triggers meant to fill taken_at
+    # (and its rollups) for rows written by older tracker builds, which
+    # cannot insert into this table at all (see version 4)
+    (11, [
+        "DROP TRIGGER IF EXISTS bmi_records_taken_at",
+        "DROP TRIGGER IF EXISTS bmi_rollups_fill",
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Takes (name, weight, height, bmi, category, date); taken_at is derived
+# from the date text by SQLite itself. Use insert_records, which also keeps
+# bmi_names up to date.
+INSERT_RECORD = (
+    "INSERT INTO bmi_records (name, weight, height, bmi, category, date, taken_at) "
+    f"VALUES (?1, ?2, ?3, ?4, ?5, ?6, {EPOCH_OF.format('?6')})"
+)
+
+
+def schema_version(db):
+    return db.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db):
+    current = schema_version(db)
+    for version, steps in MIGRATIONS:
+        if version <= current:
+            continue
+        for step in steps:
+            if callable(step):
+                step(db)
+        try:
+            # IMMEDIATE takes the write lock up front; another connection may
+            # have applied this version while we waited for it
+            db.execute("BEGIN IMMEDIATE")
+            if schema_version(db) >= version:
+                db.rollback()
+                continue
+            for step in steps:
+                if not callable(step):
+                    db.execute(step)
+            db.execute(f"PRAGMA user_version = {version}")
+            db.commit()
+        except sqlite3.Error:
+            db.rollback()
+            raise
+    return schema_version(db)
+
+
+def connect(path=DB_PATH, readonly=False, check_same_thread=True, synchronous="FULL"):
+    # WAL lets readers in any process keep going while one connection
+    # writes, and the busy timeout makes writers queue for the lock instead
+    # of failing at once. The journal mode is stored in the file, so the
+    # first connection to open it converts it for everyone. FULL sync makes
+    # every commit durable, so a save the tracker has confirmed survives a
+    # power cut. NORMAL skips that fsync and can lose the last few commits;
+    # only pass it for writes that can be redone, like resumable imports.
+    # Read-only connections skip migrations; open a writer first.
+    if synchronous not in ("FULL", "NORMAL"):
+        raise ValueError(f"synchronous must be FULL or NORMAL, not {synchronous!r}")
+    db = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=check_same_thread)
+    try:
+        if readonly:
+            db.execute("PRAGMA query_only = ON")
+        else:
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute(f"PRAGMA synchronous = {synchronous}")
+            migrate(db)
+    except sqlite3.Error:
+        db.close()
+        raise
+    return db
+
+
+@contextmanager
+def write_transaction(db):
+    # BEGIN IMMEDIATE takes the write lock before the first statement, so
+    # waiting for another process goes through the busy timeout. A deferred
+    # transaction that reads first and then writes can instead fail with
+    # "database is locked" straight away. It also keeps DDL such as DROP
+    # TRIGGER inside the transaction, where the sqlite3 module would
+    # otherwise commit it on its own.
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+    except BaseException:
+        db.rollback()
+        raise
+    db.commit()
+
+
+# One writer connection and a few reader connections for one process. The
+# writer is lent to one thread at a time, so the process never competes with
+# itself for the write lock; readers are handed out to up to `readers`
+# threads at once and only ever wait for each other, never for the writer.
+# Connections are opened on first use, the writer first so that migrations
+# are applied before any reader starts.
+class ConnectionPool:
+    def __init__(self, path=DB_PATH, readers=POOL_READERS):
+        self.path = path
+        self.readers = readers
+        self._writer = None
+        self._write_lock = threading.Lock()
+        self._open_lock = threading.Lock()
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._closed = False
+
+    def _open_writer(self):
+        with self._open_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("connection pool is closed")
+            if self._writer is None:
+                self._writer = connect(self.path, check_same_thread=False)
+            return self._writer
+
+    def _take_reader(self):
+        self._open_writer()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            fresh = self._opened < self.readers
+            if fresh:
+                self._opened += 1
+        if not fresh:
+            return self._idle.get()
+        try:
+            return connect(self.path, readonly=True, check_same_thread=False)
+        except sqlite3.Error:
+            with self._open_lock:
+                self._opened -= 1
+            raise
+
+    @contextmanager
+    def reader(self):
+        db = self._take_reader()
+        try:
+            yield db
+        finally:
+            if self._closed:
+                db.close()
+            else:
+                self._idle.put(db)
+
+    @contextmanager
+    def writer(self):
+        with self._write_lock:
+            yield self._open_writer()
+
+    def close(self):
+        with self._open_lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+def _add_names(db, rows):
+    counts = {}
+    for row in rows:
+        counts[row[0]] = counts.get(row[0], 0) + 1
+    db.executemany(
+        "INSERT INTO bmi_names (name, folded, records) VALUES (?, ?, ?) "
+        "ON CONFLICT (name) DO UPDATE SET records = records + excluded.records",
+        [(name, fold_name(name), count) for name, count in counts.items()]
+    )
+
+
+def insert_records(db, rows):
+    # Inside the caller's transaction, so the names commit with the rows
+    db.executemany(INSERT_RECORD, rows)
+    _add_names(db, rows)
+
+
+def bulk_insert(db, rows):
+    # For large batches inside the caller's transaction: the per-row rollup
+    # trigger is switched off by the bmi_bulk_insert row and the whole batch
+    # is folded into the rollups with grouped upserts, which is several
+    # times cheaper. The row never outlives the transaction, so other
+    # connections' inserts always run the trigger.
+    first = int(db.execute("SELECT COALESCE(MAX(id), 0) FROM bmi_records").fetchone()[0])
+    db.execute("INSERT INTO bmi_bulk_insert DEFAULT VALUES")
+    insert_records(db, rows)
+    db.execute("DELETE FROM bmi_bulk_insert")
+    for statement in _rollup_merge_rows(f"id > {first}"):
+        db.execute(statement)
+
+
+def record_count(db):
+    return db.execute(
+        "SELECT COALESCE(SUM(count), 0) FROM bmi_rollups WHERE period='month'"
+    ).fetchone()[0]
+
+
+def delete_records(db, ids):
+    with write_transaction(db):
+        db.executemany("DELETE FROM bmi_records WHERE id=?", [(int(record),) for record in ids])
+
+
+def clear_records(db):
+    # Emptying the table row by row would run the rollup triggers a million
+    # times; dropping them for the duration keeps this a single fast delete
+    with write_transaction(db):
+        for trigger in RECORD_TRIGGERS:
+            db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        db.execute("DELETE FROM bmi_records")
+        db.execute("DELETE FROM bmi_rollups")
+        db.execute("DELETE FROM bmi_names")
+        for statement in RECORD_TRIGGERS.values():
+            db.execute(statement)
+
+
+def history_page(db, before=None, limit=HISTORY_PAGE_SIZE, name=None):
+    # Keyset pagination: `before` is the (taken_at, id) of the last row
+    # already shown, so each page is an index range scan on
+    # idx_bmi_records_taken_at (or idx_bmi_records_name_taken_at for one
+    # user; both carry the rowid) however deep into the history it starts.
+    clauses, params = [], []
+    if name is not None:
+        clauses.append("name = ?")
+        params.append(name)
+    if before is not None:
+        clauses.append("(taken_at, id) < (?, ?)")
+        params.extend(before)
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+    return db.execute(
+        "SELECT id, name, bmi, category, date, taken_at FROM bmi_records "
+        f"{where}ORDER BY taken_at DESC, id DESC LIMIT ?",
+        (*params, limit)
+    ).fetchall()
+
+
+def _trigrams(text):
+    return {text[start:start + 3] for start in range(len(text) - 2)}
+
+
+def _typo_trigrams(text):
+    # A swapped, extra or wrong letter touches at most three trigrams, which
+    # in a short text can be all of them ("jonh" shares none with "john").
+    # Short texts therefore also use the trigrams of every copy with one
+    # character left out ("joh"); longer ones keep an intact trigram anyway,
+    # and the extra terms would only make the ranking slower.
+    grams = _trigrams(text)
+    if len(grams) < 4:
+        for skip in range(len(text)):
+            grams |= _trigrams(text[:skip] + text[skip + 1:])
+    return grams
+
+
+def _prefix_distance(query, text, limit=FUZZY_MAX_EDITS):
+    # Fewest single-character edits (insert, delete, replace, or swapping
+    # two neighbours) that turn query into some prefix of text; anything
+    # over `limit` comes back as limit + 1. Only cells within `limit` of the
+    # diagonal can stay under it, so the rest are never computed.
+    far = limit + 1
+    previous2, previous = None, [min(column, far) for column in range(len(text) + 1)]
+    for row in range(1, len(query) + 1):
+        current = [far] * (len(text) + 1)
+        current[0] = min(row, far)
+        for column in range(max(1, row - limit), min(len(text), row + limit) + 1):
+            cost = query[row - 1] != text[column - 1]
+            best = min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + cost)
+            if (row > 1 and column > 1 and query[row - 1] == text[column - 2]
+                    and query[row - 2] == text[column - 1]):
+                best = min(best, previous2[column - 2] + 1)
+            current[column] = min(best, far)
+        if min(current) == far:
+            return far
+        previous2, previous = previous, current
+    return min(previous)
+
+
+def _name_distance(query, folded):
+    # (edits, word) for the best match of the query against the start of a
+    # word of the name; on equal edits, earlier words win
+    starts = [0] + [index + 1 for index, char in enumerate(folded) if char == " "]
+    return min(
+        (_prefix_distance(query, folded[start:start + len(query) + 2]), word)
+        for word, start in enumerate(starts)
+    )
+
+
+_PREFIX_RANGE = "folded >= ?1 AND folded < ?1 || char(1114111)"
+
+
+def _near_prefixes(text):
+    # The text with one character left out or two neighbours swapped, so
+    # "jonh" also looks up names starting with "joh" and "john"
+    variants = {text[:skip] + text[skip + 1:] for skip in range(len(text))}
+    variants |= {
+        text[:index] + text[index + 1] + text[index] + text[index + 2:]
+        for index in range(len(text) - 1)
+    }
+    variants.discard(text)
+    return {variant for variant in variants if len(variant) >= 2}
+
+
+def _fuzzy_names(db, folded):
+    # Candidates come from two places: names starting with a near variant
+    # of the text (index range scans), then names sharing a trigram with
+    # the text or a one-letter-shorter copy of it (the FTS index, best
+    # ranked first), FUZZY_CANDIDATES in all. They are then ordered by edit
+    # distance, so "jonh" puts John ahead of names that merely contain "onh".
+    # Prefix matches of the text itself are already listed ahead of these.
+    candidates = {}
+
+    def collect(rows):
+        for name, records, stored in rows:
+            if len(candidates) >= FUZZY_CANDIDATES:
+                return
+            if not stored.startswith(folded):
+                candidates[name] = (records, stored)
+
+    for variant in sorted(_near_prefixes(folded)):
+        collect(db.execute(
+            f"SELECT name, records, folded FROM bmi_names WHERE {_PREFIX_RANGE} "
+            "ORDER BY folded LIMIT ?2",
+            (variant, FUZZY_CANDIDATES)
+        ))
+
+    grams = _typo_trigrams(folded)
+    if grams and len(candidates) < FUZZY_CANDIDATES:
+        match = " OR ".join('"' + gram.replace('"', '""') + '"' for gram in sorted(grams))
+        collect(db.execute(
+            "SELECT bmi_names.name, records, folded FROM bmi_name_search "
+            "JOIN bmi_names ON bmi_names.id = bmi_name_search.rowid "
+            "WHERE bmi_name_search MATCH ? ORDER BY bmi_name_search.rank LIMIT ?",
+            (match, FUZZY_CANDIDATES)
+        ))
+
+    ranked = sorted(
+        (_name_distance(folded, stored), stored, name, records)
+        for name, (records, stored) in candidates.items()
+    )
+    return [(name, records) for _, _, name, records in ranked]
+
+
+def search_names(db, text, limit=SEARCH_PAGE_SIZE, offset=0):
+    # Names starting with the text come first (alphabetically, from the
+    # folded name index), then near matches that tolerate a typo or two,
+    # such as "jonh" -> "John". Returns (name, records) pairs.
+    folded = fold_name(text.strip())
+    if not folded:
+        return []
+
+    found = db.execute(
+        f"SELECT name, records FROM bmi_names WHERE {_PREFIX_RANGE} ORDER BY folded LIMIT ?2 OFFSET ?3",
+        (folded, limit, offset)
+    ).fetchall()
+    if len(found) == limit:
+        return found
+
+    # The prefix matches ran out on this page; continue into the fuzzy ones
+    prefixed = db.execute(
+        f"SELECT COUNT(*) FROM bmi_names WHERE {_PREFIX_RANGE}", (folded,)
+    ).fetchone()[0]
+    skip = max(offset - prefixed, 0)
+    return found + _fuzzy_names(db, folded)[skip:skip + limit - len(found)]
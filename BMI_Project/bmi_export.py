@@ -0,0 +1,219 @@
+import argparse
+import csv
+import os
+import sqlite3
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+
+from bmi_calc import CATEGORIES
+from bmi_db import DATE_FORMAT, DB_PATH, EPOCH_OF, connect
+
+# Rows pulled from the cursor at a time; memory use depends on this, not on
+# the size of the table
+FETCH_SIZE = 10_000
+
+COLUMNS = ("id", "name", "weight", "height", "bmi", "category", "date")
+
+# Columnar layout: MAGIC, then one block per fetched batch so the file can
+# be written and read without holding the whole table. Each block is a
+# little-endian uint32 row count followed by the columns in order:
+#   id int64, weight/height/bmi float64, category uint8 (index into
+#   CATEGORIES), date int64 (seconds since 1970-01-01, local time),
+#   name as uint32 end offsets plus a uint32 byte length and UTF-8 bytes.
+# A block with zero rows ends the file.
+MAGIC = b"BMICOL01"
+COUNT = struct.Struct("<I")
+
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+
+
+def _range_filters(name, since, until):
+    clauses, params = [], []
+    if name:
+        clauses.append("name = ?")
+        params.append(name)
+    # Bounds are converted to taken_at once, in the query, so the range is
+    # compared as integers against the index
+    if since:
+        clauses.append(f"taken_at >= {EPOCH_OF.format('?')}")
+        params.append(since)
+    if until:
+        # A bare day includes every measurement taken on it
+        clauses.append(f"taken_at <= {EPOCH_OF.format('?')}")
+        params.append(until + " 23:59:59" if len(until) == 10 else until)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _date_bound(end):
+    # argparse type for --since/--until. SQLite's strftime turns anything it
+    # cannot read into NULL, which would match no rows at all, so bounds are
+    # checked here and passed on in the stored format.
+    def parse(value):
+        value = value.strip()
+        try:
+            try:
+                day = date.fromisoformat(value)
+            except ValueError:
+                stamp = datetime.fromisoformat(value)
+            else:
+                stamp = datetime.combine(day, datetime.max.time() if end else datetime.min.time())
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"not a date: {value!r} (use YYYY-MM-DD[ HH:MM:SS])")
+        if stamp.tzinfo is not None:
+            stamp = stamp.astimezone().replace(tzinfo=None)
+        return stamp.strftime(DATE_FORMAT)
+    return parse
+
+
+def iter_batches(db, name=None, since=None, until=None, fetch_size=FETCH_SIZE, epoch=False):
+    # name and date filters map onto idx_bmi_records_name_taken_at and
+    # idx_bmi_records_taken_at, so a filtered export is an index range scan
+    date = "taken_at" if epoch else "date"
+    where, params = _range_filters(name, since, until)
+    cursor = db.execute(
+        f"SELECT id, name, weight, height, bmi, category, {date} FROM bmi_records"
+        f"{where} ORDER BY taken_at, id",
+        params
+    )
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def export_csv(db, out, **filters):
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    total = 0
+    for rows in iter_batches(db, **filters):
+        writer.writerows(rows)
+        total += len(rows)
+    return total
+
+
+def _column(typecode, values):
+    column = array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+def encode_block(rows):
+    ids, names, weights, heights, bmis, categories, dates = zip(*rows)
+    encoded = [name.encode("utf-8") for name in names]
+    ends, position = [], 0
+    for value in encoded:
+        position += len(value)
+        ends.append(position)
+
+    return b"".join([
+        COUNT.pack(len(rows)),
+        _column("q", ids),
+        _column("d", weights),
+        _column("d", heights),
+        _column("d", bmis),
+        bytes(CATEGORY_CODES[category] for category in categories),
+        _column("q", dates),
+        _column("I", ends),
+        COUNT.pack(position),
+        b"".join(encoded),
+    ])
+
+
+def export_columnar(db, out, **filters):
+    out.write(MAGIC)
+    total = 0
+    for rows in iter_batches(db, epoch=True, **filters):
+        out.write(encode_block(rows))
+        total += len(rows)
+    out.write(COUNT.pack(0))
+    return total
+
+
+def _read_exact(source, size):
+    data = source.read(size)
+    if len(data) != size:
+        raise ValueError("Columnar export is truncated.")
+    return data
+
+
+def _read_column(source, typecode, count):
+    column = array(typecode)
+    column.frombytes(_read_exact(source, column.itemsize * count))
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+def iter_columnar(source):
+    # Yields one dict of columns per block; numeric columns are arrays that
+    # numpy.frombuffer can wrap without copying
+    if source.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a BMI columnar export.")
+    while True:
+        count = COUNT.unpack(_read_exact(source, COUNT.size))[0]
+        if not count:
+            return
+        block = {
+            "id": _read_column(source, "q", count),
+            "weight": _read_column(source, "d", count),
+            "height": _read_column(source, "d", count),
+            "bmi": _read_column(source, "d", count),
+            "category": _read_column(source, "B", count),
+            "date": _read_column(source, "q", count),
+        }
+        ends = _read_column(source, "I", count)
+        text = _read_exact(source, COUNT.unpack(_read_exact(source, COUNT.size))[0]).decode("utf-8")
+        starts = [0, *ends[:-1]]
+        block["name"] = [text[start:end] for start, end in zip(starts, ends)]
+        yield block
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export BMI records to CSV or a columnar binary file.")
+    parser.add_argument("output", help="output file, or - for CSV on stdout")
+    parser.add_argument("--db", default=DB_PATH, help=f"database file (default: {DB_PATH})")
+    parser.add_argument("--format", choices=("csv", "columnar"), default="csv")
+    parser.add_argument("--name", help="only this user's records")
+    parser.add_argument("--since", type=_date_bound(False), help="first date to include (YYYY-MM-DD[ HH:MM:SS])")
+    parser.add_argument("--until", type=_date_bound(True), help="last date to include (YYYY-MM-DD[ HH:MM:SS])")
+    args = parser.parse_args(argv)
+    filters = {"name": args.name, "since": args.since, "until": args.until}
+
+    # A read-only connection neither migrates the file nor should create it
+    if not os.path.exists(args.db):
+        print(f"Export failed: {args.db} does not exist", file=sys.stderr)
+        return 1
+
+    try:
+        db = connect(args.db, readonly=True)
+        try:
+            if args.format == "csv":
+                if args.output == "-":
+                    total = export_csv(db, sys.stdout, **filters)
+                else:
+                    with open(args.output, "w", newline="", encoding="utf-8") as out:
+                        total = export_csv(db, out, **filters)
+            else:
+                with open(args.output, "wb") as out:
+                    total = export_columnar(db, out, **filters)
+        finally:
+            db.close()
+    except BrokenPipeError:
+        # The reading end of a pipe was closed (e.g. `| head`)
+        sys.stderr.close()
+        return 0
+    except (OSError, sqlite3.Error) as err:
+        print(f"Export failed: {err}", file=sys.stderr)
+        return 1
+
+    print(f"Exported {total:,} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+from bmi_calc import measure
+from bmi_db import DATE_FORMAT, DB_PATH, bulk_insert, connect, write_transaction
+
+BATCH_SIZE = 50_000
+
+# (name, date), which sorts like the key of idx_bmi_records_name_taken_at
+_INDEX_ORDER = itemgetter(0, 5)
+
+# Applied to the importer's own connection only, which also opens with
+# NORMAL sync rather than FULL (a power cut can lose the last batch, which
+# resume then redoes)
+IMPORT_PRAGMAS = (
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def iter_csv(path):
+    with open(path, newline="", encoding="utf-8") as source:
+        reader = csv.reader(source)
+        header = [column.strip().lower() for column in next(reader, [])]
+        # Plain zip is about twice as fast as csv.DictReader; a short row
+        # simply lacks keys and is rejected
+        for row in reader:
+            yield dict(zip(header, row))
+
+
+def iter_jsonl(path):
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Counted as a rejected row rather than aborting the import
+                yield None
+
+
+READERS = {"csv": iter_csv, "jsonl": iter_jsonl}
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}; pass csv or jsonl explicitly.")
+
+
+def fingerprint(path):
+    # Size plus a hash of the first megabyte: cheap for huge files, and
+    # enough to notice that a different file now sits at the same path
+    with open(path, "rb") as source:
+        head = hashlib.blake2b(source.read(1 << 20), digest_size=16).hexdigest()
+    return f"{os.path.getsize(path)}:{head}"
+
+
+def _date(value, default):
+    if value in (None, ""):
+        return default
+    value = str(value).strip()
+    stamp = datetime.fromisoformat(value)
+    # Values already in the stored format are kept as they are; formatting
+    # every timestamp again would cost more than the rest of the row
+    if len(value) == 19 and value[10] == " ":
+        return value
+    if stamp.tzinfo is not None:
+        stamp = stamp.astimezone().replace(tzinfo=None)
+    return stamp.isoformat(" ", "seconds")
+
+
+def prepare_row(record, default_date):
+    # Same validation and rules as the Calculate button; raises ValueError,
+    # KeyError or TypeError for rows that cannot be imported
+    name = str(record["name"]).strip()
+    if not name:
+        raise ValueError("Missing name")
+    weight = float(record["weight"])
+    height = float(record["height"])
+    bmi, category = measure(weight, height)
+    return name, weight, height, bmi, category, _date(record.get("date"), default_date)
+
+
+def _load_progress(db, source, mark, restart):
+    row = db.execute(
+        "SELECT fingerprint, rows_read, rows_imported, rows_rejected, finished "
+        "FROM bmi_imports WHERE source = ?",
+        (source,)
+    ).fetchone()
+    if row is None or restart:
+        return {"read": 0, "imported": 0, "rejected": 0, "finished": False}
+
+    if row[0] != mark:
+        raise ValueError(
+            f"{source} changed since its import started; use restart to import it again."
+        )
+    return {"read": row[1], "imported": row[2], "rejected": row[3], "finished": bool(row[4])}
+
+
+def _save_progress(db, source, mark, stats):
+    db.execute(
+        "INSERT OR REPLACE INTO bmi_imports "
+        "(source, fingerprint, rows_read, rows_imported, rows_rejected, finished) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (source, mark, stats["read"], stats["imported"], stats["rejected"], int(stats["finished"]))
+    )
+
+
+def import_file(path, db_path=DB_PATH, file_format=None, batch_size=BATCH_SIZE,
+                progress=None, on_reject=None, restart=False):
+    source = os.path.abspath(path)
+    mark = fingerprint(path)
+    records = READERS[file_format or detect_format(path)](path)
+
+    db = connect(db_path, synchronous="NORMAL")
+    try:
+        for pragma in IMPORT_PRAGMAS:
+            db.execute(pragma)
+
+        stats = _load_progress(db, source, mark, restart)
+        if stats["finished"]:
+            return stats
+
+        # Rows committed by an earlier, interrupted run are skipped, not re-inserted
+        records = islice(records, stats["read"], None)
+        default_date = datetime.now().strftime(DATE_FORMAT)
+
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+
+            rows = []
+            for offset, record in enumerate(batch):
+                try:
+                    rows.append(prepare_row(record, default_date))
+                except (KeyError, TypeError, ValueError) as err:
+                    stats["rejected"] += 1
+                    if on_reject:
+                        on_reject(stats["read"] + offset + 1, record, err)
+
+            stats["read"] += len(batch)
+            stats["imported"] += len(rows)
+            # Inserting in index order keeps the (name, date) index updates
+            # on neighbouring pages
+            rows.sort(key=_INDEX_ORDER)
+            # The rows and the progress marker commit together, so a crash
+            # never leaves a batch half-imported or imported twice
+            with write_transaction(db):
+                bulk_insert(db, rows)
+                _save_progress(db, source, mark, stats)
+
+            if progress:
+                progress(stats)
+
+        stats["finished"] = True
+        with write_transaction(db):
+            _save_progress(db, source, mark, stats)
+        return stats
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import BMI measurements from CSV or JSONL.")
+    parser.add_argument("path", help="file with name, weight, height and optional date columns")
+    parser.add_argument("--db", default=DB_PATH, help=f"database file (default: {DB_PATH})")
+    parser.add_argument("--format", choices=sorted(READERS), help="input format (default: from extension)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per transaction")
+    parser.add_argument("--restart", action="store_true", help="ignore saved progress and import from the start")
+    parser.add_argument("--rejects", help="write rejected rows (line number and reason) to this file")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+
+    def report(stats):
+        rate = stats["read"] / max(time.perf_counter() - started, 1e-9)
+        print(
+            f"\r{stats['read']:,} read, {stats['imported']:,} imported, "
+            f"{stats['rejected']:,} rejected ({rate:,.0f} rows/s)",
+            end="", file=sys.stderr, flush=True
+        )
+
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+
+    def reject(number, record, err):
+        rejects.write(f"{number}\t{err}\t{json.dumps(record)}\n")
+
+    try:
+        stats = import_file(
+            args.path, args.db, args.format, args.batch_size,
+            progress=report, on_reject=reject if rejects else None, restart=args.restart
+        )
+    except (OSError, ValueError, sqlite3.Error) as err:
+        print(f"\nImport failed: {err}", file=sys.stderr)
+        return 1
+    finally:
+        if rejects:
+            rejects.close()
+
+    print(file=sys.stderr)
+    print(
+        f"{stats['imported']:,} rows imported, {stats['rejected']:,} rejected "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+import argparse
+import multiprocessing
+import random
+import sqlite3
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from bmi_calc import measure
+from bmi_chart import chart_data
+from bmi_db import (
+    DATE_FORMAT,
+    ConnectionPool,
+    connect,
+    history_page,
+    insert_records,
+    record_count,
+    search_names,
+    write_transaction,
+)
+
+# Simulates a room of kiosks saving measurements into one shared database
+# while reporting processes read from it, then checks that nothing was lost
+# and that the rollups and the name index still agree with bmi_records.
+#
+#   python bmi_loadtest.py --db load.db --writers 8 --readers 2 --seconds 30
+
+USERS = 2000
+
+
+def _user(rng, users):
+    return f"Kiosk User {rng.randrange(users):05d}"
+
+
+def _record(rng, users, start):
+    weight = round(rng.uniform(45, 120), 1)
+    height = round(rng.uniform(1.5, 2.0), 2)
+    bmi, category = measure(weight, height)
+    taken = start + timedelta(seconds=rng.randrange(365 * 86400))
+    return _user(rng, users), weight, height, bmi, category, taken.strftime(DATE_FORMAT)
+
+
+def _timed(stats, operation, job, *args):
+    began = time.perf_counter()
+    try:
+        result = job(*args)
+    except sqlite3.Error as err:
+        stats["errors"][f"{operation}: {err}"] += 1
+        return None
+    stats["latency"][operation].append(time.perf_counter() - began)
+    return result
+
+
+def _new_stats():
+    return {"latency": defaultdict(list), "errors": Counter(), "inserted": 0, "deleted": 0}
+
+
+def kiosk(number, path, users, seconds, pause, ready, go, results):
+    # One tracker process: short write transactions through its pool's single
+    # writer, like RecordWriter batches and history deletes, with a read of
+    # its own history now and then
+    rng = random.Random(number)
+    start = datetime(2024, 1, 1)
+    stats = _new_stats()
+    pool = ConnectionPool(path)
+
+    def save(db, rows):
+        with write_transaction(db):
+            insert_records(db, rows)
+        return len(rows)
+
+    def delete_one(db, name):
+        with write_transaction(db):
+            return db.execute(
+                "DELETE FROM bmi_records WHERE id = "
+                "(SELECT id FROM bmi_records WHERE name = ? ORDER BY taken_at DESC LIMIT 1)",
+                (name,)
+            ).rowcount
+
+    def with_writer(job, *args):
+        with pool.writer() as db:
+            return job(db, *args)
+
+    def with_reader(job, *args):
+        with pool.reader() as db:
+            return job(db, *args)
+
+    try:
+        with_reader(record_count)
+        ready.release()
+        go.wait()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            roll = rng.random()
+            if roll < 0.05:
+                deleted = _timed(stats, "kiosk delete", with_writer, delete_one, _user(rng, users))
+                stats["deleted"] += deleted or 0
+            elif roll < 0.15:
+                _timed(stats, "kiosk history", with_reader, history_page, None, 50, _user(rng, users))
+            else:
+                rows = [_record(rng, users, start) for _ in range(rng.randint(1, 5))]
+                stats["inserted"] += _timed(stats, "kiosk save", with_writer, save, rows) or 0
+            time.sleep(rng.uniform(0, pause))
+    finally:
+        pool.close()
+        results.put(stats)
+
+
+def reporter(number, path, users, seconds, ready, go, results):
+    # A reporting process: searches, history pages, charts and totals back to
+    # back on its pool's reader connections, never touching the writer
+    rng = random.Random(-1 - number)
+    stats = _new_stats()
+    pool = ConnectionPool(path)
+
+    def with_reader(job, *args):
+        with pool.reader() as db:
+            return job(db, *args)
+
+    try:
+        with_reader(record_count)
+        ready.release()
+        go.wait()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            roll = rng.random()
+            name = _user(rng, users)
+            if roll < 0.3:
+                prefix = name[:rng.randint(12, len(name))]
+                _timed(stats, "report search", with_reader, search_names, prefix)
+            elif roll < 0.6:
+                _timed(stats, "report history", with_reader, history_page)
+            elif roll < 0.9:
+                _timed(stats, "report chart", with_reader, chart_data, name)
+            else:
+                _timed(stats, "report count", with_reader, record_count)
+    finally:
+        pool.close()
+        results.put(stats)
+
+
+def check_consistency(path):
+    # Returns a list of problems; every trigger-maintained table must match
+    # a recount from bmi_records
+    problems = []
+    db = connect(path)
+    try:
+        records = db.execute("SELECT COUNT(*) FROM bmi_records").fetchone()[0]
+        for period in ("day", "week", "month"):
+            total = db.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM bmi_rollups WHERE period = ?", (period,)
+            ).fetchone()[0]
+            if total != records:
+                problems.append(f"{period} rollups count {total:,} records, table has {records:,}")
+        named = db.execute("SELECT COALESCE(SUM(records), 0) FROM bmi_names").fetchone()[0]
+        if named != records:
+            problems.append(f"bmi_names counts {named:,} records, table has {records:,}")
+        stale = db.execute(
+            "SELECT COUNT(*) FROM bmi_names AS n WHERE records != "
+            "(SELECT COUNT(*) FROM bmi_records WHERE name = n.name)"
+        ).fetchone()[0]
+        if stale:
+            problems.append(f"{stale:,} names have a wrong record count")
+        try:
+            db.execute("INSERT INTO bmi_name_search (bmi_name_search) VALUES ('integrity-check')")
+        except sqlite3.Error as err:
+            problems.append(f"name search index: {err}")
+        return records, problems
+    finally:
+        db.close()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test a shared BMI database with concurrent processes.")
+    parser.add_argument("--db", default="bmi_loadtest.db", help="database file to test (default: bmi_loadtest.db)")
+    parser.add_argument("--writers", type=int, default=4, help="kiosk processes saving records")
+    parser.add_argument("--readers", type=int, default=2, help="reporting processes running queries")
+    parser.add_argument("--seconds", type=float, default=10, help="how long to run")
+    parser.add_argument("--users", type=int, default=USERS, help="distinct user names")
+    parser.add_argument("--pause", type=float, default=0.01, help="longest pause between kiosk operations, in seconds")
+    args = parser.parse_args(argv)
+
+    # Applies migrations (and WAL mode) once, before the processes race to do it
+    try:
+        before, _ = check_consistency(args.db)
+    except sqlite3.Error as err:
+        print(f"Cannot open {args.db}: {err}", file=sys.stderr)
+        return 1
+
+    context = multiprocessing.get_context("spawn")
+    ready = context.Semaphore(0)
+    go = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=kiosk, args=(number, args.db, args.users, args.seconds, args.pause, ready, go, results))
+        for number in range(args.writers)
+    ] + [
+        context.Process(target=reporter, args=(number, args.db, args.users, args.seconds, ready, go, results))
+        for number in range(args.readers)
+    ]
+    for process in processes:
+        process.start()
+    # Everyone starts together once every pool has opened the database
+    for _ in processes:
+        ready.acquire()
+    print(f"{args.writers} kiosks and {args.readers} reporters running for {args.seconds:g}s on {args.db}")
+    go.set()
+
+    totals = _new_stats()
+    for _ in processes:
+        stats = results.get()
+        totals["inserted"] += stats["inserted"]
+        totals["deleted"] += stats["deleted"]
+        totals["errors"].update(stats["errors"])
+        for operation, values in stats["latency"].items():
+            totals["latency"][operation].extend(values)
+    for process in processes:
+        process.join()
+
+    print(f"{'operation':<16}{'count':>9}{'per s':>9}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for operation, values in sorted(totals["latency"].items()):
+        print(
+            f"{operation:<16}{len(values):>9,}{len(values) / args.seconds:>9,.0f}"
+            f"{_percentile(values, 0.5) * 1000:>9.1f}{_percentile(values, 0.95) * 1000:>9.1f}"
+            f"{max(values) * 1000:>9.1f}"
+        )
+
+    failed = False
+    for message, count in totals["errors"].most_common():
+        print(f"error x{count}: {message}", file=sys.stderr)
+        failed = True
+
+    after, problems = check_consistency(args.db)
+    expected = before + totals["inserted"] - totals["deleted"]
+    if after != expected:
+        problems.append(f"expected {expected:,} records, found {after:,}")
+    for problem in problems:
+        print(f"inconsistent: {problem}", file=sys.stderr)
+        failed = True
+
+    print(
+        f"{totals['inserted']:,} rows saved, {totals['deleted']:,} deleted, "
+        f"{after:,} in the database; {'FAILED' if failed else 'ok'}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
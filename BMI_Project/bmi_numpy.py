@@ -0,0 +1,67 @@
+import numpy as np
+
+from bmi_calc import CATEGORIES, CATEGORY_THRESHOLDS, MAX_HEIGHT, bmi_value
+
+# Rows are processed in slices of this size to bound temporary memory
+CHUNK_ROWS = 1_000_000
+
+# Category code given to rows that fail validation
+INVALID = len(CATEGORIES)
+
+CATEGORY_LABELS = np.array(CATEGORIES + ("",))
+
+_THRESHOLDS = np.array(CATEGORY_THRESHOLDS, dtype=np.float64)
+
+
+def _measure_chunk(weights, heights):
+    valid = (
+        np.isfinite(weights) & np.isfinite(heights)
+        & (weights > 0) & (heights > 0) & (heights <= MAX_HEIGHT)
+    )
+    # Invalid rows may divide by zero or hold NaN; they are masked below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = weights / (heights * heights)
+        bmi = np.round(raw, 2)
+
+        # Two things only matter when raw * 100 lands within a hair of .5:
+        # np.round scales by 100 and rounds half to even, unlike Python's
+        # round(), and heights * heights can be one ulp off the height ** 2
+        # that bmi_calc uses. Those rows are rare, so they are redone with
+        # bmi_value itself to match compute_bmi exactly.
+        scaled = raw * 100
+        near_half = valid & (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for index in np.flatnonzero(near_half):
+        bmi[index] = bmi_value(float(weights[index]), float(heights[index]))
+
+    codes = np.searchsorted(_THRESHOLDS, bmi, side="right").astype(np.uint8)
+    bmi[~valid] = np.nan
+    codes[~valid] = INVALID
+    return bmi, codes, ~valid
+
+
+def measure_array(weights, heights):
+    # Same bounds, formula and thresholds as bmi_calc.measure, for whole
+    # columns at once. Returns BMI values (NaN where invalid), category codes
+    # (indexes into CATEGORIES, INVALID for rejected rows) and the invalid
+    # mask.
+    weights = np.asarray(weights, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+    if weights.shape != heights.shape or weights.ndim != 1:
+        raise ValueError("Expected weight and height arrays of the same length.")
+
+    count = weights.shape[0]
+    bmi = np.empty(count, dtype=np.float64)
+    codes = np.empty(count, dtype=np.uint8)
+    invalid = np.empty(count, dtype=bool)
+
+    for start in range(0, count, CHUNK_ROWS):
+        stop = start + CHUNK_ROWS
+        bmi[start:stop], codes[start:stop], invalid[start:stop] = _measure_chunk(
+            weights[start:stop], heights[start:stop]
+        )
+
+    return bmi, codes, invalid
+
+
+def category_labels(codes):
+    return CATEGORY_LABELS[codes]
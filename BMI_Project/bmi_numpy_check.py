@@ -0,0 +1,70 @@
+import argparse
+import sys
+
+import numpy as np
+
+from bmi_calc import measure
+from bmi_numpy import CATEGORIES, INVALID, measure_array
+
+# Compares measure_array against bmi_calc.measure row by row, on random rows
+# plus rows whose BMI sits right on a half cent, where rounding is fragile,
+# plus rows that must be rejected. Exits 1 on any difference.
+#
+#   python bmi_numpy_check.py --rows 500000 --seed 1
+
+
+def sample(rows, seed):
+    rng = np.random.default_rng(seed)
+    heights = rng.uniform(1.0, 2.5, rows)
+    weights = rng.uniform(20, 250, rows)
+
+    # Weights that put the BMI on x.xx5, nudged by up to a few ulps either way
+    half_heights = rng.uniform(1.0, 2.5, rows)
+    targets = (rng.integers(1000, 6000, rows) + 0.5) / 100
+    half_weights = targets * half_heights ** 2
+    half_weights = half_weights + rng.integers(-4, 5, rows) * np.spacing(half_weights)
+
+    invalid_weights = np.array([np.nan, np.inf, -np.inf, 0.0, -70.0, 70.0, 70.0, 70.0, 70.0, 70.0])
+    invalid_heights = np.array([1.75, 1.75, 1.75, 1.75, 1.75, np.nan, np.inf, 0.0, -1.75, 3.5])
+
+    return (
+        np.concatenate((weights, half_weights, invalid_weights)),
+        np.concatenate((heights, half_heights, invalid_heights)),
+    )
+
+
+def mismatches(weights, heights):
+    bmi, codes, invalid = measure_array(weights, heights)
+    for index, (weight, height) in enumerate(zip(weights.tolist(), heights.tolist())):
+        try:
+            expected = measure(weight, height)
+        except ValueError:
+            expected = None
+
+        if expected is None:
+            if not invalid[index] or codes[index] != INVALID:
+                yield weight, height, expected, (float(bmi[index]), CATEGORIES[codes[index]])
+        elif invalid[index] or float(bmi[index]) != expected[0] or CATEGORIES[codes[index]] != expected[1]:
+            got = None if invalid[index] else (float(bmi[index]), CATEGORIES[codes[index]])
+            yield weight, height, expected, got
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check bmi_numpy against the scalar BMI rules.")
+    parser.add_argument("--rows", type=int, default=500_000, help="random rows, and as many half-cent rows")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args(argv)
+
+    weights, heights = sample(args.rows, args.seed)
+    found = 0
+    for weight, height, expected, got in mismatches(weights, heights):
+        found += 1
+        if found <= 20:
+            print(f"w={weight!r} h={height!r}: scalar {expected}, vector {got}", file=sys.stderr)
+
+    print(f"{len(weights):,} rows checked, {found:,} mismatches")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
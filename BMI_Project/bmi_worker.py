@@ -0,0 +1,133 @@
+import queue
+import threading
+
+
+# How often the UI thread picks up finished requests; about one frame
+POLL_MS = 16
+
+_STOP = object()
+
+
+class Request:
+    def __init__(self, job, args, on_done, on_error, owner, write, wait_for):
+        self.job = job
+        self.args = args
+        self.write = write
+        self.wait_for = wait_for
+        self.on_done = on_done
+        self.on_error = on_error
+        self.owner = owner
+        self.cancelled = False
+
+
+# Runs database jobs on its own threads so the Tk thread never executes SQL.
+# A job is any callable taking a connection as its first argument: a reader
+# from the pool, or the pool's single writer for jobs submitted with
+# write=True. Reads therefore never queue behind a write, and up to
+# pool.readers of them run at once. Finished requests are handed back to the
+# UI by dispatch(), which the tracker schedules with window.after, so
+# callbacks always run on the Tk thread. Cancelled requests are skipped if
+# still queued, interrupted if running, and their callbacks never fire. A
+# request can also wait for a threading.Event (such as RecordWriter.mark())
+# before it borrows its connection.
+class DatabaseWorker:
+    def __init__(self, pool, on_error=None):
+        self.pool = pool
+        self.on_error = on_error
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = set()
+        # Running request -> the connection it is using
+        self._running = {}
+        self._threads = [
+            threading.Thread(target=self._run, name=f"bmi-db-{number}", daemon=True)
+            for number in range(max(pool.readers, 1))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, job, *args, on_done=None, on_error=None, owner=None, write=False,
+               wait_for=None):
+        request = Request(job, args, on_done, on_error, owner, write, wait_for)
+        with self._lock:
+            self._pending.add(request)
+        self.requests.put(request)
+        return request
+
+    def cancel(self, request):
+        with self._lock:
+            request.cancelled = True
+            db = self._running.get(request)
+            if db is not None:
+                # Aborts the statement in progress with "interrupted"
+                db.interrupt()
+
+    def cancel_owner(self, owner):
+        # Used when a window closes: drops every request it made
+        with self._lock:
+            requests = [request for request in self._pending if request.owner is owner]
+        for request in requests:
+            self.cancel(request)
+
+    def dispatch(self):
+        # Called on the Tk thread
+        while True:
+            try:
+                request, result, error = self.results.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self._pending.discard(request)
+            if request.cancelled:
+                continue
+            if error is None:
+                if request.on_done:
+                    request.on_done(result)
+            else:
+                handler = request.on_error or self.on_error
+                if handler:
+                    handler(error)
+
+    def close(self, timeout=None):
+        # Reads are dropped, but writes the user already confirmed (deletes,
+        # clearing everything) still run before the threads stop
+        with self._lock:
+            requests = [request for request in self._pending if not request.write]
+        for request in requests:
+            self.cancel(request)
+        for _ in self._threads:
+            self.requests.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _execute(self, request):
+        if request.wait_for is not None:
+            request.wait_for.wait()
+        borrow = self.pool.writer if request.write else self.pool.reader
+        with borrow() as db:
+            with self._lock:
+                if request.cancelled:
+                    return None
+                self._running[request] = db
+            try:
+                return request.job(db, *request.args)
+            finally:
+                # Cleared before the connection goes back to the pool, so a
+                # late cancel cannot interrupt whoever borrows it next
+                with self._lock:
+                    del self._running[request]
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            if request is _STOP:
+                break
+
+            result, error = None, None
+            if not request.cancelled:
+                try:
+                    result = self._execute(request)
+                except Exception as err:
+                    error = err
+            self.results.put((request, result, error))
@@ -0,0 +1,88 @@
+import queue
+import sqlite3
+import threading
+import time
+
+from bmi_db import insert_records, write_transaction
+
+# A saved record reaches disk at most this long after it was submitted
+MAX_DELAY = 0.05
+MAX_BATCH = 1000
+
+_STOP = object()
+
+
+# Inserts submitted from the UI are queued and committed by a dedicated
+# thread. Everything that arrives within MAX_DELAY of the first pending row
+# shares one transaction, so a burst of saves costs one fsync instead of
+# one each, and the Tk thread never waits on the disk. Batches go through the
+# pool's writer connection, shared with the database worker's write jobs.
+class RecordWriter:
+    def __init__(self, pool, max_delay=MAX_DELAY, max_batch=MAX_BATCH):
+        self.pool = pool
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.pending = queue.Queue()
+        # Batches of rows once they are committed, and (rows, error) for
+        # batches that could not be; the UI reports both to the user
+        self.saved = queue.Queue()
+        self.failures = queue.Queue()
+        self.committed = 0
+        self._thread = threading.Thread(target=self._run, name="bmi-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        self.pending.put(row)
+
+    def mark(self):
+        # An event that is set once every row submitted so far is committed
+        # (or failed)
+        done = threading.Event()
+        self.pending.put(done)
+        return done
+
+    def flush(self, timeout=None):
+        return self.mark().wait(timeout)
+
+    def close(self, timeout=None):
+        if self._thread.is_alive():
+            self.pending.put(_STOP)
+            self._thread.join(timeout)
+
+    def _next_batch(self):
+        rows, waiters = [], []
+        item = self.pending.get()
+        deadline = time.monotonic() + self.max_delay
+
+        while True:
+            if item is _STOP:
+                return rows, waiters, True
+            if isinstance(item, threading.Event):
+                # A flush commits whatever is queued right away
+                waiters.append(item)
+                return rows, waiters, False
+            rows.append(item)
+            if len(rows) >= self.max_batch:
+                return rows, waiters, False
+
+            remaining = deadline - time.monotonic()
+            try:
+                item = self.pending.get(timeout=remaining) if remaining > 0 else self.pending.get_nowait()
+            except queue.Empty:
+                return rows, waiters, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            rows, waiters, stopping = self._next_batch()
+            if rows:
+                try:
+                    with self.pool.writer() as db, write_transaction(db):
+                        insert_records(db, rows)
+                    self.committed += len(rows)
+                except sqlite3.Error as err:
+                    self.failures.put((rows, err))
+                else:
+                    self.saved.put(rows)
+            for waiter in waiters:
+                waiter.set()